@@ -17,23 +17,30 @@ FAILSAFE MECHANISMS (Anti-hang protection):
 2. Thread Watchdog - Background thread timeout after 5 seconds
 """
 
+from __future__ import annotations
+
 import sys
 import os
 import logging
 import time
 import threading
-from typing import Optional, Dict
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Dict, TYPE_CHECKING
 from dataclasses import dataclass
 from PyQt6.QtWidgets import QApplication, QWidget
 from PyQt6.QtCore import (
     Qt,
     QRect,
+    QLine,
     QPropertyAnimation,
     QEasingCurve,
     pyqtProperty,
     QPoint,
     pyqtSignal,
     QTimer,
+    QRunnable,
+    QThreadPool,
 )
 from PyQt6.QtGui import (
     QKeyEvent,
@@ -43,9 +50,14 @@ from PyQt6.QtGui import (
     QPixmap,
     QMouseEvent,
     QImage,
+    QRegion,
+    QCursor,
+    QFont,
+    QFontMetrics,
+    QPen,
+    QStaticText,
+    QTransform,
 )
-from PIL import Image
-from captix.utils.capture import ScreenCapture, list_visible_windows
 from captix.utils.clipboard import copy_image_to_clipboard
 from captix.utils.window_detect import WindowDetector, WindowInfo
 from captix.utils.theme import CaptiXColors
@@ -53,8 +65,16 @@ from captix.utils.magnifier import MagnifierWidget
 from captix.utils.notifications import notify_screenshot_saved, send_notification
 from captix.utils.external_watchdog import ExternalWatchdog
 
+if TYPE_CHECKING:
+    # Imported where used at runtime, so PIL and the X11 capture stack load on
+    # the capture worker while the overlay window is being set up
+    from PIL import Image
+    from captix.utils.capture import ScreenCapture
+
 # Set up logging
-logging.basicConfig(level=logging.DEBUG)  # Enable debug logging
+# Launch-path progress is INFO, per-event hot path logging DEBUG - raise the
+# level here when diagnosing; by default only problems reach stderr
+logging.basicConfig(level=logging.WARNING)
 logger = logging.getLogger(__name__)
 
 # Failsafe configuration
@@ -76,6 +96,9 @@ class UIConstants:
     CLICK_THRESHOLD_MS = 200  # Max time for click vs drag (milliseconds)
     DRAG_THRESHOLD_PX = 5  # Min pixel movement to start drag
     WINDOW_DETECTION_MOVEMENT_PX = 10  # Min movement to trigger window detection
+    WINDOW_CAPTURE_TIMEOUT_S = 2.0  # Max wait for a clicked window's pending capture
+    HIT_CACHE_BUCKET_SHIFT = 3  # Stack walk results cached per 8x8 pixel bucket
+    HIT_CACHE_MAX_ENTRIES = 256  # Max cached stack walk results
 
     # Window size filters (pixels)
     MIN_WINDOW_SIZE_CAPTURE = 200  # Minimum window size to capture
@@ -90,14 +113,19 @@ class UIConstants:
     WATCHDOG_CHECK_INTERVAL_MS = 1000  # How often to check watchdogs
     HEARTBEAT_UPDATE_INTERVAL_MS = 1000  # How often to update external watchdog
 
+    # Repaint throttling
+    FALLBACK_REFRESH_RATE_HZ = 60  # Used when the screen reports no refresh rate
+
 
-@dataclass
+@dataclass(slots=True)
 class CapturedWindow:
     """Stores a captured window with its metadata at capture time."""
 
     window_info: WindowInfo
-    image: Image.Image  # PIL Image of just this window (content-only, borders excluded)
+    image: Optional[Image.Image]  # PIL Image of just this window (released once qpixmap is built)
+    qimage: Optional[QImage] = None  # Converted off the GUI thread, released once qpixmap is built
     qpixmap: Optional[QPixmap] = None  # Cached QPixmap for efficient rendering
+    pixel_buffer: Optional[bytes] = None  # Pixel data qpixmap may share (must outlive it)
     geometry: QRect = None  # Position/size at capture time (content-only)
     left_border: int = 0  # Left border size that was excluded
     top_border: int = 0  # Top border size that was excluded
@@ -122,12 +150,67 @@ class CapturedWindow:
             )
 
 
+class SaveScreenshotTask(QRunnable):
+    """Saves a screenshot, copies it to the clipboard and notifies, on a pool thread.
+
+    PNG encoding of a full-screen image takes long enough to hold the overlay
+    open visibly, so the overlay hands the finished image to this task and
+    closes immediately.
+    """
+
+    def __init__(
+        self,
+        capture_system: ScreenCapture,
+        image: Image.Image,
+        capture_type: str,
+        description: str,
+        bgra: bool = False,
+    ):
+        super().__init__()
+        self.capture_system = capture_system
+        self.image = image
+        self.capture_type = capture_type
+        self.description = description  # e.g. "Area capture (640x480 pixels)"
+        self.bgra = bgra  # image is an "RGBA" view of BGRA bytes - swapped here, off the UI thread
+
+    def run(self):
+        """Save, copy and notify; exceptions must not escape into the pool thread."""
+        try:
+            if self.bgra:
+                from PIL import Image
+
+                blue, green, red, _ = self.image.split()
+                self.image = Image.merge("RGB", (red, green, blue))
+            filepath, file_size = self.capture_system.save_screenshot(
+                self.image, capture_type=self.capture_type
+            )
+            # Copy to clipboard
+            if copy_image_to_clipboard(filepath):
+                logger.info(f"{self.description} completed ({file_size} bytes)")
+            else:
+                logger.warning(f"Failed to copy {self.description} to clipboard")
+            # Show notification with sound
+            try:
+                notify_screenshot_saved(filepath, file_size)
+            except Exception as e:
+                logger.warning(f"Failed to show notification: {e}")
+        except (OSError, IOError, PermissionError) as e:
+            logger.error(f"Failed to save {self.description}: {e}")
+        except Exception as e:
+            logger.error(f"Error saving {self.description}: {e}")
+        finally:
+            self.image = None
+
+
 class ScreenshotOverlay(QWidget):
     """Full-screen transparent overlay for screenshot selection."""
 
     # Signal emitted when captures are complete
     captures_complete = pyqtSignal()
 
+    # Signal emitted when an on-demand window capture is stored (window_id)
+    window_captured = pyqtSignal(int)
+
     # Signal emitted when recording area is selected (video mode)
     # Parameters: (x, y, width, height, is_fullscreen, window_id, track_window)
     recording_area_selected = pyqtSignal(int, int, int, int, bool, int, bool)
@@ -142,6 +225,13 @@ class ScreenshotOverlay(QWidget):
         self.video_mode = video_mode
         self.pending_recording_params = None  # Store recording params to emit after close
         self.frozen_screen: Optional[QPixmap] = None
+        self._dimmed_screen: Optional[QPixmap] = None  # frozen_screen with dark overlay pre-applied
+        # Frozen and dimmed screen at capture resolution (rescaled from on resize)
+        self._captured_screen_pixmaps: Optional[tuple] = None
+        # Pixel data shared by the captured pixmaps - kept for the overlay's lifetime
+        # since the magnifier may still hold frozen_screen
+        self._screen_buffers: Optional[tuple] = None
+        self._warned_no_frozen_screen = False  # Fallback background warning logged
         self.capture_system: Optional[ScreenCapture] = None
         self.window_detector: Optional[WindowDetector] = None
         self._overlay_opacity: float = 0.0  # Start with no opacity
@@ -151,15 +241,47 @@ class ScreenshotOverlay(QWidget):
         self.captured_windows: Dict[
             int, CapturedWindow
         ] = {}  # window_id -> captured content
+        self._capturable_windows: Dict[int, WindowInfo] = {}  # window_id -> window eligible for capture
+        self._window_capture_futures: Dict[int, Future] = {}  # window_id -> queued capture job
+        self._capture_executor: Optional[ThreadPoolExecutor] = None  # Single capture worker
         self.frozen_full_image: Optional[Image.Image] = (
-            None  # PIL version for area cutting
+            None  # PIL version for area cutting (only kept when the capture has alpha)
         )
+        # Zero-copy PIL view of the frozen screen buffer, in BGRA channel order
+        self._frozen_bgra_view: Optional[Image.Image] = None
 
         # Window highlighting state
         self.highlighted_window: Optional[WindowInfo] = None
         self.cursor_x: int = 0
         self.cursor_y: int = 0
         self.last_detection_pos: tuple = (-1, -1)  # Track last detection position
+        self._global_origin = QPoint(0, 0)  # Overlay position on screen (refreshed on show/move)
+        self._overlay_rect = QRect()  # Cached self.rect() for the paint path (refreshed on resize)
+
+        # Selection dimensions label font (font lookup is too slow to repeat per paint)
+        self._dimensions_font = QFont("Arial", 12, QFont.Weight.Bold)  # Smaller font size
+        self._dimensions_font_metrics = QFontMetrics(self._dimensions_font)
+        self._dimensions_static_text = QStaticText()  # Laid out once per distinct label
+        self._dimensions_static_text.setTextFormat(Qt.TextFormat.PlainText)
+        self._dimensions_last_text = ""
+        self._dimensions_layout: Optional[tuple] = None  # (selection rect, background rect, text)
+
+        # Pens shared by every paint
+        self._border_pen = self._create_dash_dot_pen()  # Window highlight and selection border
+        self._guideline_pen = self._create_dash_dot_pen()  # Crosshair guidelines (dash offset varies)
+        self._text_pen = QPen(CaptiXColors.WHITE_TEXT)  # White text
+        self._text_pen.setWidth(1)
+        # Dark overlay color shared by every paint (alpha follows the overlay opacity)
+        self._dark_overlay_color = QColor(CaptiXColors.DARK_OVERLAY_BLACK)
+        # Stack walk results by cursor bucket (the frozen desktop doesn't change)
+        self._hit_cache: OrderedDict[tuple, WindowInfo] = OrderedDict()
+        # Client-side hit test table: (x1, y1, x2, y2, WindowInfo) in top-to-bottom order,
+        # WindowInfo is None for windows that aren't capture targets (docks, desktop)
+        self._window_hit_table: Optional[tuple] = None
+        # Highlighted window's rectangle when nothing is stacked over it: (x1, y1, x2, y2)
+        self._highlight_hit_rect: Optional[tuple] = None
+        # Highlight layout for the current target: (key, visible rect, source rect)
+        self._highlight_layout: Optional[tuple] = None
 
         # Mouse click tracking state
         self.mouse_pressed: bool = False
@@ -186,53 +308,103 @@ class ScreenshotOverlay(QWidget):
 
         # Magnifier widget state
         self.magnifier: Optional[MagnifierWidget] = None
+        self.magnifier_window_id: Optional[int] = None  # Own top-level window, excluded from hit testing
 
         # Failsafe timers
         self.heartbeat_timer: Optional[QTimer] = None  # For external watchdog
 
-        # External watchdog (works even if Qt event loop freezes)
-        self.external_watchdog: Optional[ExternalWatchdog] = None
-
-        self.setup_window()
-        self.setup_failsafe_timers()
+        # Repaint throttling - mouse moves mark the overlay dirty, timer repaints
+        self._repaint_timer: Optional[QTimer] = None
+        self._dirty_region: QRegion = QRegion()  # Area to repaint on the next flush
+        self._guideline_strips: tuple = (QRegion(), QRegion())  # Horizontal, vertical guideline areas
+        self._target_region: QRegion = QRegion()  # Area covered by the selection or highlight
 
-        # Initialize window detection BEFORE screen capture for proper filtering
-        self.setup_window_detection()
+        # Move throttling - mouse moves are coalesced and processed once per frame
+        self._move_timer: Optional[QTimer] = None
+        self._pending_move_pos: Optional[QPoint] = None  # Latest unprocessed global cursor position
 
-        # Setup geometry and animation before captures for instant display
-        self.setup_geometry()
-        self.setup_animation()
-        self.setup_magnifier()
+        # External watchdog (works even if Qt event loop freezes)
+        self.external_watchdog: Optional[ExternalWatchdog] = None
 
-        # Defer screen captures - will be done after window is shown
+        # Window collection is deferred until the window is shown (showEvent)
         self._captures_complete = False
         self._capture_lock = threading.Lock()
 
         # Thread Safety Design:
         # =====================
-        # This overlay uses a read-after-initialization pattern for thread safety:
+        # All capture work runs on a single worker thread (_capture_executor), so
+        # X11 capture calls never run concurrently with each other:
+        #
+        # 0. FROZEN SCREEN (capture worker, submitted before window setup):
+        #    - Worker only captures and packs pixel buffers and returns them
+        #    - Main thread joins the Future in showEvent and builds the pixmaps
         #
-        # 1. INITIALIZATION PHASE (background thread, protected by lock):
-        #    - Background thread captures windows and populates captured_windows dict
-        #    - All writes are protected by _capture_lock
+        # 1. INITIALIZATION PHASE (capture worker, protected by lock):
+        #    - Worker collects _capturable_windows and the _window_hit_table
+        #      snapshot of window rectangles
         #    - Sets _captures_complete = True when done
         #    - Emits captures_complete signal to notify main thread
         #
-        # 2. OPERATIONAL PHASE (main thread, no lock needed):
-        #    - Main thread receives captures_complete signal
-        #    - After signal, captured_windows becomes effectively read-only
-        #    - No more writes from background thread
-        #    - Main thread reads captured_windows without locks (safe after signal)
-        #    - Python's GIL + signal/slot mechanism provides happens-before guarantee
+        # 2. OPERATIONAL PHASE (main thread queues, worker captures):
+        #    - Main thread receives captures_complete signal; afterwards
+        #      _capturable_windows and _window_hit_table are read-only
+        #    - Hovering or clicking a window queues its capture on the worker
+        #      (only the main thread touches _window_capture_futures)
+        #    - Worker inserts into captured_windows under _capture_lock and emits
+        #      window_captured; entries are never modified once inserted
+        #    - Main thread reads captured_windows without locks (single dict
+        #      lookups are atomic under the GIL)
+        #    - _window_hit_table is only consulted once _captures_complete is set
         #
         # 3. CLEANUP PHASE (main thread, protected by lock):
+        #    - Worker is shut down (pending captures cancelled) before cleanup
         #    - captured_windows.clear() is protected by lock (defensive)
         #
         # This pattern avoids lock contention on every paint event while maintaining
-        # thread safety. The lock is only needed during initialization and cleanup.
+        # thread safety. The lock is only needed for worker writes and cleanup.
 
-        # Connect signal for thread-safe capture completion
-        self.captures_complete.connect(self._on_captures_complete)
+        # Screenshot mode: start grabbing the screen on the capture worker now so
+        # it overlaps with the window setup below (joined in showEvent)
+        self._frozen_screen_future: Optional[Future] = None
+        self._window_collection_future: Optional[Future] = None
+        if not self.video_mode:
+            self._capture_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="captix-capture"
+            )
+            self._frozen_screen_future = self._capture_executor.submit(
+                self._capture_frozen_screen_buffers, UIConstants.OVERLAY_OPACITY
+            )
+
+        try:
+            self.setup_window()
+            self.setup_failsafe_timers()
+            self.setup_repaint_timer()
+
+            # Initialize window detection BEFORE screen capture for proper filtering
+            self.setup_window_detection()
+
+            # Setup geometry and animation before captures for instant display
+            self.setup_geometry()
+            self.setup_animation()
+            self.setup_magnifier()
+
+            # Connect signals for thread-safe capture completion
+            self.captures_complete.connect(self._on_captures_complete)
+            self.window_captured.connect(self._on_window_captured)
+        except Exception:
+            # Don't leave the capture worker thread running behind a failed overlay
+            if self._capture_executor:
+                self._capture_executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    @staticmethod
+    def _create_dash_dot_pen() -> QPen:
+        """Create the blue dash-dot pen used for highlights, selection and guidelines."""
+        pen = QPen(CaptiXColors.THEME_BLUE)  # Blue border that stands out better
+        pen.setWidth(UIConstants.HIGHLIGHT_BORDER_WIDTH)  # 2 pixel width for better visibility over any content
+        pen.setStyle(Qt.PenStyle.DashDotLine)  # Dash-dot style
+        pen.setCosmetic(True)  # Width in device pixels - no transform math
+        return pen
 
     def setup_window(self):
         """Configure the overlay window properties."""
@@ -243,8 +415,14 @@ class ScreenshotOverlay(QWidget):
             | Qt.WindowType.Tool
         )
 
-        # Set window to be transparent
-        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
+        if self.video_mode:
+            # Set window to be transparent so the live desktop shows through
+            self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
+        else:
+            # The frozen screenshot covers every pixel opaquely - skip the
+            # transparent clear and background erase before each paint
+            self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+            self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, True)
 
         # Accept focus to receive key events
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
@@ -263,74 +441,231 @@ class ScreenshotOverlay(QWidget):
 
         logger.debug("Overlay window configured")
 
-    def capture_frozen_screen(self):
-        """Capture the current screen state to use as frozen background (immediate, not in thread)."""
+    def _capture_frozen_screen_buffers(self, overlay_opacity: float) -> Optional[tuple]:
+        """Capture the screen and pack the frozen and dimmed pixel buffers.
+
+        Runs on the capture worker, started from __init__ so the X11 round trip
+        and pixel packing overlap with the overlay window setup. Only PIL and
+        bytes are produced here; Qt images are built on the main thread.
+
+        Args:
+            overlay_opacity: Dark overlay opacity to pre-dim the screen with
+
+        Returns:
+            Tuple of (image bytes, dimmed bytes, zero-copy BGRA view of the image
+            bytes, original RGBA image or None), or None if the capture failed
+        """
         try:
+            from PIL import Image
+            from captix.utils.capture import get_shared_screen_capture
+
             logger.debug("Capturing frozen screen background...")
 
-            # Initialize capture system
-            self.capture_system = ScreenCapture()
-
-            # Capture full screen with cursor (immediate)
-            screen_image = self.capture_system.capture_full_screen(include_cursor=True)
-
-            if screen_image:
-                # Store the PIL version for area cutting
-                self.frozen_full_image = screen_image.copy()
-
-                # Convert PIL Image to QPixmap for background display
-                # First convert PIL image to RGB if it's in RGBA mode
-                if screen_image.mode == "RGBA":
-                    # Create a white background and paste the image on it
-                    background = Image.new("RGB", screen_image.size, (255, 255, 255))
-                    background.paste(
-                        screen_image, mask=screen_image.split()[-1]
-                    )  # Use alpha channel as mask
-                    screen_image = background
-                elif screen_image.mode != "RGB":
-                    screen_image = screen_image.convert("RGB")
-
-                # Convert PIL image to bytes
-                image_bytes = screen_image.tobytes()
-                width, height = screen_image.size
-
-                # Create QPixmap from image data
-                # QImage format: RGB888 for 24-bit RGB
-                qimage = QImage(image_bytes, width, height, QImage.Format.Format_RGB888)
-                self.frozen_screen = QPixmap.fromImage(qimage)
+            # Capture full screen with cursor (shared capture system, opened once per process)
+            screen_image = get_shared_screen_capture().capture_full_screen(include_cursor=True)
+            if not screen_image:
+                return None
+
+            # The overlay is opaque, so the pixels are shown as captured with
+            # alpha forced to 0xff - the QImage RGB32 layout expects an opaque alpha byte
+            opaque_alpha_lut = [255] * 256
+            alpha_image = None
+            if screen_image.mode == "RGBA":
+                # The opaque pixmap buffer can't reproduce the alpha channel,
+                # so keep the original for area cutting
+                alpha_image = screen_image
+                # One lookup pass copies the image with opaque alpha
+                screen_image = screen_image.point(list(range(256)) * 3 + opaque_alpha_lut)
+            else:
+                # Expand to RGBA (opaque alpha)
+                screen_image = screen_image.convert("RGBA")
+
+            # Pack as BGRA - the QImage RGB32 layout on little-endian, so
+            # fromImage needs no conversion pass. All pixel work in CaptiX stays in
+            # Pillow's C routines (tobytes, frombuffer, point, raw decoders): numpy
+            # isn't a dependency (requirements.txt) and isn't worth adding for
+            # passes Pillow already does in a single C loop
+            image_bytes = screen_image.tobytes("raw", "BGRA")
+            size = screen_image.size
+            del screen_image  # Only the packed buffer is needed from here on
+
+            # Zero-copy view of the packed buffer (channels read as RGBA, stored BGRA)
+            bgra_view = Image.frombuffer("RGBA", size, image_bytes, "raw", "RGBA", 0, 1)
+
+            # Pre-dim the frozen screen with a per-channel lookup table so the
+            # regular paint path is a single opaque blit (no alpha blending).
+            # B, G and R share the table, so it applies to the view as stored
+            alpha = int(overlay_opacity * 255)
+            dimming_lut = [value * (255 - alpha) // 255 for value in range(256)] * 3
+            dimmed_bytes = bgra_view.point(dimming_lut + opaque_alpha_lut).tobytes()
+
+            return image_bytes, dimmed_bytes, bgra_view, alpha_image
+
+        except Exception as e:
+            # Screen capture via X11 can fail for various reasons (display issues,
+            # compositor problems, resource constraints). UI continues with degraded functionality.
+            logger.error(f"Error capturing frozen screen: {e}")
+            return None
+
+    def capture_frozen_screen(self):
+        """Build the frozen background from the screen capture started in __init__.
+
+        Blocks until the capture worker has the pixel buffers (capturing here
+        directly if no capture was started).
+        """
+        try:
+            if self._frozen_screen_future:
+                screen_buffers = self._frozen_screen_future.result()
+                self._frozen_screen_future = None
+            else:
+                screen_buffers = self._capture_frozen_screen_buffers(self._overlay_opacity)
+
+            # Initialize capture system (shared for the process, already open by now)
+            from captix.utils.capture import get_shared_screen_capture
+
+            self.capture_system = get_shared_screen_capture()
+
+            if screen_buffers:
+                image_bytes, dimmed_bytes, bgra_view, alpha_image = screen_buffers
+                self.frozen_full_image = alpha_image
+                width, height = bgra_view.size
+
+                # Without a format conversion the pixmaps keep sharing the buffers
+                self._screen_buffers = (image_bytes, dimmed_bytes)
+
+                # Area cutting reads the same buffer instead of a separate PIL copy
+                self._frozen_bgra_view = bgra_view
+
+                # Create QPixmaps from image data
+                qimage = QImage(image_bytes, width, height, width * 4, QImage.Format.Format_RGB32)
+                self.frozen_screen = QPixmap.fromImage(qimage, Qt.ImageConversionFlag.NoFormatConversion)
+                dimmed_qimage = QImage(dimmed_bytes, width, height, width * 4, QImage.Format.Format_RGB32)
+                self._dimmed_screen = QPixmap.fromImage(dimmed_qimage, Qt.ImageConversionFlag.NoFormatConversion)
+
+                # Keep the capture-resolution pixmaps and size copies to the overlay
+                self._captured_screen_pixmaps = (self.frozen_screen, self._dimmed_screen)
+                self._fit_screen_pixmaps()
+
+                # The frozen screen never changes afterwards - hand it to the magnifier once
+                if self.magnifier:
+                    self.magnifier.set_source_image(self.frozen_screen)
 
                 logger.info(f"Frozen screen captured: {width}x{height}")
             else:
                 logger.error("Failed to capture screen for frozen background")
 
         except Exception as e:
-            # Screen capture via PyQt6/X11 can fail for various reasons (display issues,
-            # compositor problems, resource constraints). UI continues with degraded functionality.
+            # Qt image setup can fail (e.g. resource constraints). UI continues
+            # with degraded functionality.
             logger.error(f"Error capturing frozen screen: {e}")
             self.frozen_screen = None
+            self._dimmed_screen = None
             self.frozen_full_image = None
+            self._frozen_bgra_view = None
+
+    def _get_frozen_image(self, box: Optional[tuple] = None) -> Optional[Image.Image]:
+        """Get the frozen desktop, or a region of it, as a PIL image for saving.
+
+        Unless the capture had alpha, this is the "RGBA" view of the packed BGRA
+        buffer (see _frozen_image_is_bgra); SaveScreenshotTask fixes the channel
+        order on the pool thread.
 
-    def capture_all_windows(self):
-        """Capture all visible windows individually with workspace filtering."""
+        Args:
+            box: Optional (left, top, right, bottom) crop box
+
+        Returns:
+            PIL image, or None if no frozen screen was captured
+        """
+        image = self.frozen_full_image
+        if image is None:
+            image = self._frozen_bgra_view
+        if image is None:
+            return None
+        return image.crop(box) if box else image
+
+    @property
+    def _frozen_image_is_bgra(self) -> bool:
+        """Whether _get_frozen_image returns BGRA bytes rather than a real RGB(A) image."""
+        return self.frozen_full_image is None
+
+    def _fit_screen_pixmaps(self):
+        """Size the frozen and dimmed screen pixmaps to the overlay once.
+
+        Paints then always blit 1:1 instead of rescaling the whole screen
+        pixmap on every repaint. A dimmed pixmap dropped by an opacity change
+        stays unset and is rebuilt by _get_dimmed_screen.
+        """
+        if not self._captured_screen_pixmaps:
+            return
+
+        frozen_screen, dimmed_screen = self._captured_screen_pixmaps
+        if frozen_screen.size() != self.size() and not self.size().isEmpty():
+            logger.info(
+                f"Scaling frozen screen {frozen_screen.width()}x{frozen_screen.height()} "
+                f"to overlay {self.width()}x{self.height()}"
+            )
+            frozen_screen = frozen_screen.scaled(
+                self.size(),
+                Qt.AspectRatioMode.IgnoreAspectRatio,
+                Qt.TransformationMode.FastTransformation,
+            )
+            if dimmed_screen is not None:
+                dimmed_screen = dimmed_screen.scaled(
+                    self.size(),
+                    Qt.AspectRatioMode.IgnoreAspectRatio,
+                    Qt.TransformationMode.FastTransformation,
+                )
+
+        self.frozen_screen = frozen_screen
+        self._dimmed_screen = dimmed_screen
+
+    def collect_capturable_windows(self):
+        """Collect the visible windows eligible for capture with workspace filtering.
+
+        Window content itself is captured on demand (see capture_window) - in the
+        common area-selection case no window is ever captured.
+        """
         # Defensive check: prevent modifications after initialization complete
         if self._captures_complete:
             raise RuntimeError(
-                "Cannot capture windows after initialization complete. "
-                "This indicates a programming error - captures should only run during initialization."
+                "Cannot collect windows after initialization complete. "
+                "This indicates a programming error - collection should only run during initialization."
             )
 
         try:
             logger.info(
-                "Capturing visible windows with workspace and minimized filtering..."
+                "Collecting visible windows with workspace and minimized filtering..."
             )
 
+            from captix.utils.capture import list_visible_windows
+
             # Get list of all visible windows
             all_visible_windows = list_visible_windows()
 
             # Apply workspace and minimized filtering
             if hasattr(self, "window_detector") and self.window_detector:
-                filtered_windows = self.window_detector.filter_windows_for_capture(
-                    all_visible_windows
+                # Keep small windows for hit testing - only capture is limited by size
+                workspace_windows = self.window_detector.filter_windows_for_capture(
+                    all_visible_windows, min_size=0
+                )
+                filtered_windows = [
+                    w
+                    for w in workspace_windows
+                    if not self.window_detector.is_window_too_small(w, UIConstants.MIN_WINDOW_SIZE_CAPTURE)
+                ]
+
+                # Snapshot window rectangles top-to-bottom (stack order is bottom-to-top).
+                # Docks, desktop and other windows left out of the capture list still
+                # cover what is below them - they become blockers with no WindowInfo.
+                # Our own overlay and magnifier windows are left out entirely
+                own_window_ids = {getattr(self, "overlay_window_id", None), self.magnifier_window_id}
+                windows_by_id = {w.window_id: w for w in workspace_windows}
+                self._window_hit_table = tuple(
+                    (x1, y1, x2, y2, windows_by_id.get(window_id))
+                    for window_id, x1, y1, x2, y2 in reversed(
+                        self.window_detector.get_window_stack_rects()
+                    )
+                    if window_id not in own_window_ids
                 )
             else:
                 # Fallback to basic filtering if no window detector available
@@ -343,59 +678,140 @@ class ScreenshotOverlay(QWidget):
                     f"Using basic filtering: {len(filtered_windows)} out of {len(all_visible_windows)} windows"
                 )
 
-            captured_count = 0
             skipped_count = 0
 
             for window_info in filtered_windows:
-                try:
-                    # Additional skip check for very small windows (system windows)
-                    if window_info.width < UIConstants.MIN_WINDOW_SIZE_SYSTEM and window_info.height < UIConstants.MIN_WINDOW_SIZE_SYSTEM:
-                        logger.debug(
-                            f"Skipping small window: {window_info.title} ({window_info.width}x{window_info.height})"
-                        )
-                        skipped_count += 1
-                        continue
-
-                    # Capture this window's pure content without cursor
-                    result = self.capture_system.capture_window_pure_content(
-                        window_info.window_id, include_cursor=False
+                # Additional skip check for very small windows (system windows)
+                if window_info.width < UIConstants.MIN_WINDOW_SIZE_SYSTEM and window_info.height < UIConstants.MIN_WINDOW_SIZE_SYSTEM:
+                    logger.debug(
+                        f"Skipping small window: {window_info.title} ({window_info.width}x{window_info.height})"
                     )
+                    skipped_count += 1
+                    continue
 
-                    if result:
-                        # Unpack the result tuple (image, left_border, top_border)
-                        window_image, left_border, top_border = result
+                self._capturable_windows[window_info.window_id] = window_info
 
-                        # Store the captured window with border information
-                        captured_window = CapturedWindow(
-                            window_info=window_info,
-                            image=window_image,
-                            left_border=left_border,
-                            top_border=top_border,
-                        )
+            logger.info(
+                f"Window collection complete: {len(self._capturable_windows)} capturable, {skipped_count} skipped"
+            )
 
-                        self.captured_windows[window_info.window_id] = captured_window
-                        captured_count += 1
+        except Exception as e:
+            logger.error(f"Error collecting windows: {e}")
+            # Continue with no capturable windows - overlay will still work with basic highlighting
 
-                        logger.debug(
-                            f"Captured window: {window_info.title} ({window_info.class_name}) "
-                            f"{window_info.width}x{window_info.height}"
-                        )
-                    else:
-                        logger.debug(f"Failed to capture window: {window_info.title}")
-                        skipped_count += 1
+    def capture_window(self, window_info: WindowInfo) -> Optional[CapturedWindow]:
+        """Capture a single window's content (runs on the window capture worker).
 
-                except Exception as e:
-                    logger.warning(f"Error capturing window {window_info.title}: {e}")
-                    skipped_count += 1
-                    continue
+        The window is grabbed live when it is first hovered or clicked, after the
+        frozen desktop was taken. Content that kept updating in the meantime (a
+        video, a terminal) is saved as it is now, not as shown on the frozen screen.
+        """
+        try:
+            # Capture this window's pure content without cursor
+            result = self.capture_system.capture_window_pure_content(
+                window_info.window_id, include_cursor=False
+            )
 
-            logger.info(
-                f"Window capture complete: {captured_count} captured, {skipped_count} skipped"
+            if not result:
+                logger.debug(f"Failed to capture window: {window_info.title}")
+                return None
+
+            # Unpack the result tuple (image, left_border, top_border)
+            window_image, left_border, top_border = result
+
+            # Store the captured window with border information
+            captured_window = CapturedWindow(
+                window_info=window_info,
+                image=window_image,
+                left_border=left_border,
+                top_border=top_border,
             )
 
+            # Do the PIL -> QImage conversion here rather than on the GUI thread
+            self.prepare_window_qimage(captured_window)
+
+            with self._capture_lock:
+                self.captured_windows[window_info.window_id] = captured_window
+
+            logger.debug(
+                f"Captured window: {window_info.title} ({window_info.class_name}) "
+                f"{window_info.width}x{window_info.height}"
+            )
+
+            # Notify main thread (thread-safe)
+            self.window_captured.emit(window_info.window_id)
+            return captured_window
+
         except Exception as e:
-            logger.error(f"Error capturing windows: {e}")
-            # Continue with empty captured windows dict - overlay will still work with basic highlighting
+            logger.warning(f"Error capturing window {window_info.title}: {e}")
+            return None
+
+    def _request_window_capture(self, window_info: WindowInfo) -> Optional[Future]:
+        """Queue a capture of the window on the capture worker unless already queued."""
+        if not self._capture_executor or window_info.window_id not in self._capturable_windows:
+            return None
+
+        future = self._window_capture_futures.get(window_info.window_id)
+        if future is None:
+            future = self._capture_executor.submit(self.capture_window, window_info)
+            self._window_capture_futures[window_info.window_id] = future
+            logger.debug(f"Queued capture for window: {window_info.title}")
+        return future
+
+    def _wait_for_window_capture(self, window_info: WindowInfo) -> bool:
+        """Make sure the window is captured, waiting for its capture if it is still pending."""
+        if window_info.window_id in self.captured_windows:
+            return True
+
+        future = self._request_window_capture(window_info)
+        if future is None:
+            return False
+
+        try:
+            future.result(timeout=UIConstants.WINDOW_CAPTURE_TIMEOUT_S)
+        except Exception as e:
+            logger.warning(f"Window capture for '{window_info.title}' did not complete: {e}")
+        return window_info.window_id in self.captured_windows
+
+    def _on_window_captured(self, window_id: int):
+        """Handle on-demand window capture completion in main thread."""
+        if self.highlighted_window and self.highlighted_window.window_id == window_id:
+            # Content-only geometry and preview are now available for the highlight
+            self._request_repaint(refresh_target=True)
+
+    def prepare_window_qimage(self, captured_window: CapturedWindow):
+        """Convert a captured window's PIL image into a QImage ready for QPixmap upload.
+
+        Runs on the capture worker right after the capture, so the GUI thread
+        only has to wrap the prepared QImage in a QPixmap.
+        """
+        pil_image = captured_window.image
+
+        # Handle alpha channel properly to avoid white borders
+        if pil_image.mode == "RGBA":
+            # Instead of white background, use transparent background
+            # or convert more carefully to preserve the original look
+
+            # Pack straight into premultiplied BGRA, which is the QImage
+            # ARGB32_Premultiplied layout on little-endian - the format Qt
+            # keeps alpha pixmaps in, so fromImage needs no conversion pass
+            width, height = pil_image.size
+            image_bytes = pil_image.tobytes("raw", "BGRa")
+            bytes_per_line = width * 4  # 4 bytes per pixel for BGRA
+            image_format = QImage.Format.Format_ARGB32_Premultiplied
+        else:
+            # Opaque capture (any other mode): expand to BGRA with an opaque
+            # alpha byte, which is the QImage RGB32 layout on little-endian -
+            # the format Qt keeps opaque pixmaps in, so no conversion pass
+            width, height = pil_image.size
+            image_bytes = pil_image.convert("RGBA").tobytes("raw", "BGRA")
+            bytes_per_line = width * 4  # 4 bytes per pixel for BGRA
+            image_format = QImage.Format.Format_RGB32
+
+        # QImage only borrows image_bytes, and without a format conversion
+        # the pixmap keeps sharing it - retain the buffer alongside it
+        captured_window.pixel_buffer = image_bytes
+        captured_window.qimage = QImage(image_bytes, width, height, bytes_per_line, image_format)
 
     def get_window_qpixmap(self, window_id: int) -> Optional[QPixmap]:
         """Get or create QPixmap for a captured window for efficient rendering."""
@@ -408,64 +824,23 @@ class ScreenshotOverlay(QWidget):
         if captured_window.qpixmap is not None:
             return captured_window.qpixmap
 
-        # Convert PIL image to QPixmap and cache it
+        # Upload the prepared QImage to a QPixmap and cache it
         try:
-            pil_image = captured_window.image
-
-            # Handle alpha channel properly to avoid white borders
-            if pil_image.mode == "RGBA":
-                # Instead of white background, use transparent background
-                # or convert more carefully to preserve the original look
-
-                # Option 1: Convert RGBA directly to QImage to preserve alpha
-                width, height = pil_image.size
-                image_bytes = pil_image.tobytes()
-                bytes_per_line = width * 4  # 4 bytes per pixel for RGBA
-
-                qimage = QImage(
-                    image_bytes,
-                    width,
-                    height,
-                    bytes_per_line,
-                    QImage.Format.Format_RGBA8888,
-                )
-                qpixmap = QPixmap.fromImage(qimage)
-
-            elif pil_image.mode != "RGB":
-                # Convert other modes to RGB
-                pil_image = pil_image.convert("RGB")
-                width, height = pil_image.size
-                image_bytes = pil_image.tobytes()
-                bytes_per_line = width * 3  # 3 bytes per pixel for RGB
-
-                qimage = QImage(
-                    image_bytes,
-                    width,
-                    height,
-                    bytes_per_line,
-                    QImage.Format.Format_RGB888,
-                )
-                qpixmap = QPixmap.fromImage(qimage)
-            else:
-                # Already RGB format
-                width, height = pil_image.size
-                image_bytes = pil_image.tobytes()
-                bytes_per_line = width * 3  # 3 bytes per pixel for RGB
-
-                qimage = QImage(
-                    image_bytes,
-                    width,
-                    height,
-                    bytes_per_line,
-                    QImage.Format.Format_RGB888,
-                )
-                qpixmap = QPixmap.fromImage(qimage)
+            if captured_window.qimage is None:
+                # Normally prepared on the capture worker
+                self.prepare_window_qimage(captured_window)
 
-            # Cache the QPixmap for future use
+            qimage = captured_window.qimage
+            qpixmap = QPixmap.fromImage(qimage, Qt.ImageConversionFlag.NoFormatConversion)
+
+            # Cache the QPixmap for future use and drop the PIL copy - the
+            # save path re-derives it from the pixmap (see get_window_image)
             captured_window.qpixmap = qpixmap
+            captured_window.qimage = None
+            captured_window.image = None
 
             logger.debug(
-                f"Created QPixmap for window {window_id}: {width}x{height} ({pil_image.mode})"
+                f"Created QPixmap for window {window_id}: {qimage.width()}x{qimage.height()} ({qimage.format().name})"
             )
             return qpixmap
 
@@ -473,6 +848,34 @@ class ScreenshotOverlay(QWidget):
             logger.warning(f"Failed to convert window {window_id} to QPixmap: {e}")
             return None
 
+    def get_window_image(self, captured_window: CapturedWindow) -> Optional[Image.Image]:
+        """Get the PIL image of a captured window, re-deriving it from the QPixmap if released."""
+        if captured_window.image is not None:
+            return captured_window.image
+
+        if captured_window.qpixmap is None:
+            return None
+
+        try:
+            from PIL import Image
+
+            if captured_window.qpixmap.hasAlphaChannel():
+                qimage = captured_window.qpixmap.toImage().convertToFormat(QImage.Format.Format_RGBA8888)
+                mode = "RGBA"
+            else:
+                qimage = captured_window.qpixmap.toImage().convertToFormat(QImage.Format.Format_RGB888)
+                mode = "RGB"
+
+            bits = qimage.constBits()
+            bits.setsize(qimage.sizeInBytes())
+            return Image.frombytes(
+                mode, (qimage.width(), qimage.height()), bytes(bits), "raw", mode, qimage.bytesPerLine()
+            )
+
+        except Exception as e:
+            logger.warning(f"Failed to convert window {captured_window.window_info.window_id} to PIL image: {e}")
+            return None
+
     def setup_geometry(self):
         """Prepare window for fullscreen mode."""
         app = QApplication.instance()
@@ -480,23 +883,18 @@ class ScreenshotOverlay(QWidget):
             logger.error("No QApplication instance found")
             return
 
-        # Get all screens for logging purposes
-        screens = app.screens()
-        if screens:
-            # Calculate combined geometry of all screens for logging
-            combined_rect = QRect()
-            for screen in screens:
-                screen_geometry = screen.geometry()
-                logger.info(
-                    f"Screen found: {screen_geometry.width()}x{screen_geometry.height()} at ({screen_geometry.x()}, {screen_geometry.y()})"
-                )
-                combined_rect = combined_rect.united(screen_geometry)
-
-            logger.info(
-                f"Overlay prepared for fullscreen mode covering: {combined_rect.width()}x{combined_rect.height()}"
-            )
-        else:
+        primary_screen = app.primaryScreen()
+        if not primary_screen:
             logger.error("No screens found")
+            return
+
+        # Qt keeps the union of all screens - no per-screen walk needed
+        virtual_geometry = primary_screen.virtualGeometry()
+        logger.debug(
+            "Overlay prepared for fullscreen mode covering: %dx%d",
+            virtual_geometry.width(),
+            virtual_geometry.height(),
+        )
 
     def setup_animation(self):
         """Set up the fade-in animation for the window and dark overlay."""
@@ -506,12 +904,28 @@ class ScreenshotOverlay(QWidget):
         self.fade_animation.setStartValue(0.0)  # Start transparent
         self.fade_animation.setEndValue(1.0)  # End fully visible
         self.fade_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+        self.fade_animation.finished.connect(self._on_fade_in_finished)
 
         # Set the dark overlay to target opacity immediately (no separate animation)
         self._overlay_opacity = UIConstants.OVERLAY_OPACITY
 
         logger.debug("Fade animation configured (0.25s, window opacity 0% to 100%)")
 
+    def _on_fade_in_finished(self):
+        """Catch up on the cursor position once the overlay is fully visible."""
+        cursor_pos = QCursor.pos()
+        self.cursor_x = cursor_pos.x()
+        self.cursor_y = cursor_pos.y()
+
+        if self.magnifier and self.frozen_screen:
+            self.magnifier.update_cursor_position(self.cursor_x, self.cursor_y)
+            self.magnifier.show_magnifier()
+
+        if not self.is_dragging:
+            self.update_window_highlight(self.cursor_x, self.cursor_y)
+
+        self._request_repaint()
+
     def setup_window_detection(self):
         """Initialize window detection system."""
         try:
@@ -532,10 +946,12 @@ class ScreenshotOverlay(QWidget):
         """Initialize the magnifier widget."""
         try:
             self.magnifier = MagnifierWidget()
+            self.magnifier_window_id = int(self.magnifier.winId())
             logger.info(f"Magnifier widget initialized ({MagnifierWidget.MAGNIFIER_SIZE}x{MagnifierWidget.MAGNIFIER_SIZE}px)")
         except Exception as e:
             logger.error(f"Failed to initialize magnifier widget: {e}")
             self.magnifier = None
+            self.magnifier_window_id = None
 
     def setup_failsafe_timers(self):
         """Initialize all failsafe timers and watchdogs."""
@@ -552,6 +968,92 @@ class ScreenshotOverlay(QWidget):
         except Exception as e:
             logger.error(f"Failed to start external watchdog: {e}")
 
+    def setup_repaint_timer(self):
+        """Initialize the timers that coalesce mouse moves and repaints to the display refresh rate."""
+        refresh_rate = UIConstants.FALLBACK_REFRESH_RATE_HZ
+        screen = QApplication.primaryScreen() if QApplication.instance() else None
+        if screen and screen.refreshRate() > 0:
+            refresh_rate = screen.refreshRate()
+
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.setInterval(max(1, int(1000 / refresh_rate)))
+        self._repaint_timer.timeout.connect(self._flush_repaint)
+
+        # High polling rate mice report several moves per frame - only the latest matters
+        self._move_timer = QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(self._repaint_timer.interval())
+        self._move_timer.timeout.connect(self._flush_mouse_move)
+        logger.debug("Repaint timer configured (%.0f Hz)", refresh_rate)
+
+    def _request_repaint(self, refresh_target: bool = False):
+        """Mark the changed overlay area dirty; the repaint timer flushes it at most once per frame.
+
+        Only decorations that changed are invalidated, at their previous and
+        current position: a guideline strip only when the cursor moved along its
+        axis, and the selection or highlighted window only when it changed or
+        refresh_target is set (its content changed in place).
+        """
+        guideline_strips = self._get_guideline_strips()
+        for old_strip, new_strip in zip(self._guideline_strips, guideline_strips):
+            if old_strip != new_strip:
+                self._dirty_region = self._dirty_region.united(old_strip).united(new_strip)
+        self._guideline_strips = guideline_strips
+
+        target_region = self._get_target_region()
+        if refresh_target or target_region != self._target_region:
+            self._dirty_region = self._dirty_region.united(self._target_region).united(
+                target_region
+            )
+        self._target_region = target_region
+
+        if self._repaint_timer and not self._repaint_timer.isActive():
+            self._repaint_timer.start()
+
+    def _flush_repaint(self):
+        """Issue a single repaint for all changes since the last frame."""
+        if not self._dirty_region.isEmpty():
+            self.update(self._dirty_region)
+            self._dirty_region = QRegion()
+
+    def _get_guideline_strips(self) -> tuple:
+        """Get the overlay areas covered by the horizontal and vertical crosshair guidelines."""
+        if self.is_dragging:
+            # Guidelines are hidden while dragging (see draw_crosshair_guidelines)
+            return QRegion(), QRegion()
+
+        pad = UIConstants.HIGHLIGHT_BORDER_WIDTH
+        return (
+            QRegion(0, self.cursor_y - pad, self.width(), 2 * pad + 1),
+            QRegion(self.cursor_x - pad, 0, 2 * pad + 1, self.height()),
+        )
+
+    def _get_target_region(self) -> QRegion:
+        """Get the overlay area covered by the selection (with its label) or highlighted window."""
+        pad = UIConstants.HIGHLIGHT_BORDER_WIDTH
+        region = QRegion()
+        if self.selection_rect and self.is_dragging:
+            region = QRegion(self.selection_rect.adjusted(-pad, -pad, pad, pad))
+            dimensions_rect = self._get_selection_dimensions_layout()[0]
+            if dimensions_rect:
+                region = region.united(QRegion(dimensions_rect))
+        elif self.highlighted_window and not self.highlighted_window.is_root:
+            # Full window bounds always contain the content-only highlight geometry
+            window = self.highlighted_window
+            region = QRegion(
+                QRect(window.x, window.y, window.width, window.height).adjusted(
+                    -pad, -pad, pad, pad
+                )
+            )
+
+        return region
+
+    def _get_decoration_region(self) -> QRegion:
+        """Get the overlay area covered by crosshair guidelines, selection and highlight."""
+        horizontal_strip, vertical_strip = self._get_guideline_strips()
+        return horizontal_strip.united(vertical_strip).united(self._get_target_region())
+
     def _update_external_watchdog_heartbeat(self):
         """Update the external watchdog heartbeat to signal we're still responsive."""
         if self.external_watchdog:
@@ -583,22 +1085,50 @@ class ScreenshotOverlay(QWidget):
         self.cursor_y = y
 
         # Only update detection if cursor moved significantly (reduce frequency)
-        distance_moved = abs(x - self.last_detection_pos[0]) + abs(
-            y - self.last_detection_pos[1]
-        )
-        if distance_moved < UIConstants.WINDOW_DETECTION_MOVEMENT_PX:  # Only detect every 10 pixels of movement
+        dx = x - self.last_detection_pos[0]
+        dy = y - self.last_detection_pos[1]
+        if dx * dx + dy * dy < UIConstants.WINDOW_DETECTION_MOVEMENT_PX ** 2:  # Only detect every 10 pixels of movement
             return
 
         self.last_detection_pos = (x, y)
 
+        # Still inside the unobstructed highlighted window - the result can't change
+        hit_rect = self._highlight_hit_rect
+        if (
+            hit_rect
+            and self.highlighted_window is not None
+            and hit_rect[0] <= x < hit_rect[2]
+            and hit_rect[1] <= y < hit_rect[3]
+        ):
+            return
+
         try:
-            # Get window beneath our overlay using stack walking
-            # Add timing to detect if X11 calls are blocking
-            detection_start = time.perf_counter()
-            window_info = self.window_detector.get_window_at_position_excluding(
-                x, y, exclude_window_id=getattr(self, "overlay_window_id", None)
-            )
-            detection_time = time.perf_counter() - detection_start
+            # Fast path: look the point up in the captured window rectangles
+            window_info = self._hit_test_window_table(x, y)
+            detection_time = 0.0
+
+            if window_info is None:
+                # Reuse the stack walk result when the cursor returns to an already probed bucket
+                bucket = (
+                    x >> UIConstants.HIT_CACHE_BUCKET_SHIFT,
+                    y >> UIConstants.HIT_CACHE_BUCKET_SHIFT,
+                )
+                window_info = self._hit_cache.get(bucket)
+                if window_info is not None:
+                    self._hit_cache.move_to_end(bucket)
+                else:
+                    # Get window beneath our overlay using stack walking
+                    # Add timing to detect if X11 calls are blocking
+                    detection_start = time.perf_counter()
+                    window_info = self.window_detector.get_window_at_position_excluding(
+                        x, y, exclude_window_id=getattr(self, "overlay_window_id", None)
+                    )
+                    detection_time = time.perf_counter() - detection_start
+
+                    if window_info is not None and self._is_uniform_hit_bucket(bucket):
+                        self._hit_cache[bucket] = window_info
+                        if len(self._hit_cache) > UIConstants.HIT_CACHE_MAX_ENTRIES:
+                            self._hit_cache.popitem(last=False)
 
             # Log if window detection is slow (>100ms could freeze event loop)
             if detection_time > 0.100:
@@ -610,36 +1140,102 @@ class ScreenshotOverlay(QWidget):
                     f"[PERF] Window detection at ({x},{y}) took {detection_time*1000:.1f}ms"
                 )
 
-            # Debug: Log the detected window information (only when it changes)
-            if window_info != self.highlighted_window:
-                if window_info:
-                    logger.info(
-                        f"Detected window at {x},{y}: {window_info.title} ({window_info.class_name}) "
-                        f"size: {window_info.width}x{window_info.height} at {window_info.x},{window_info.y} "
-                        f"is_root: {window_info.is_root}"
-                    )
-                else:
-                    logger.info(f"No window detected at {x},{y}")
-
-            # Only update if the window changed
-            if window_info != self.highlighted_window:
-                self.highlighted_window = window_info
-
-                if window_info and not window_info.is_root:
-                    logger.debug(
-                        f"Highlighting window: {window_info.title} ({window_info.class_name}) "
-                        f"at {window_info.x},{window_info.y} {window_info.width}x{window_info.height}"
-                    )
-                else:
-                    logger.debug("Cursor on desktop - clearing highlight")
-
-                # Trigger repaint to update highlight
-                self.update()
+            self._set_highlighted_window(window_info, x, y)
 
         except Exception as e:
             logger.error(f"Error updating window highlight: {e}")
             self.highlighted_window = None
 
+    def _hit_test_window_table(self, x: int, y: int) -> Optional[WindowInfo]:
+        """Find the topmost captured window rectangle containing the point.
+
+        Returns None when the table isn't ready yet, no window contains the
+        point or the topmost one is a dock, desktop or other non-capture window,
+        in which case the caller falls back to the X11 stack walk.
+        """
+        if not self._captures_complete or not self._window_hit_table:
+            return None
+
+        for x1, y1, x2, y2, window_info in self._window_hit_table:
+            if x1 <= x < x2 and y1 <= y < y2:
+                return window_info
+        return None
+
+    def _is_uniform_hit_bucket(self, bucket: tuple) -> bool:
+        """Check that no window rectangle edge crosses the cache bucket.
+
+        Every point of such a bucket lies inside the same windows, so one stack
+        walk result holds for all of them. False while the table isn't ready.
+        """
+        if not self._captures_complete or not self._window_hit_table:
+            return False
+
+        size = 1 << UIConstants.HIT_CACHE_BUCKET_SHIFT
+        bx1, by1 = bucket[0] * size, bucket[1] * size
+        bx2, by2 = bx1 + size, by1 + size
+        for x1, y1, x2, y2, _ in self._window_hit_table:
+            if x1 < bx2 and bx1 < x2 and y1 < by2 and by1 < y2:
+                if not (x1 <= bx1 and bx2 <= x2 and y1 <= by1 and by2 <= y2):
+                    return False
+        return True
+
+    def _get_unobstructed_rect(self, window_info: Optional[WindowInfo]) -> Optional[tuple]:
+        """Get the window's rectangle if no window above it overlaps it.
+
+        Any point inside such a rectangle hit-tests to the window itself. Returns
+        None when the table isn't ready, the window isn't in it, or it is overlapped.
+        """
+        if not window_info or not self._captures_complete or not self._window_hit_table:
+            return None
+
+        x1, y1 = window_info.x, window_info.y
+        x2, y2 = x1 + window_info.width, y1 + window_info.height
+        for other_x1, other_y1, other_x2, other_y2, other in self._window_hit_table:
+            if other is window_info:
+                return (x1, y1, x2, y2)
+            if other_x1 < x2 and x1 < other_x2 and other_y1 < y2 and y1 < other_y2:
+                return None
+        return None
+
+    def _set_highlighted_window(self, window_info: Optional[WindowInfo], x: int, y: int):
+        """Update the highlighted window and schedule a repaint if it changed."""
+        # Only update if the window changed
+        if window_info == self.highlighted_window:
+            return
+
+        # Debug: Log the detected window information (only when it changes)
+        if window_info:
+            logger.info(
+                f"Detected window at {x},{y}: {window_info.title} ({window_info.class_name}) "
+                f"size: {window_info.width}x{window_info.height} at {window_info.x},{window_info.y} "
+                f"is_root: {window_info.is_root}"
+            )
+        else:
+            logger.info(f"No window detected at {x},{y}")
+
+        self.highlighted_window = window_info
+        self._highlight_hit_rect = self._get_unobstructed_rect(window_info)
+
+        if window_info and not window_info.is_root:
+            logger.debug(
+                "Highlighting window: %s (%s) at %d,%d %dx%d",
+                window_info.title,
+                window_info.class_name,
+                window_info.x,
+                window_info.y,
+                window_info.width,
+                window_info.height,
+            )
+        else:
+            logger.debug("Cursor on desktop - clearing highlight")
+
+        # Capture hovered windows ahead of a click or preview
+        if window_info and not window_info.is_root:
+            self._request_window_capture(window_info)
+
+        # Schedule repaint to update highlight
+        self._request_repaint()
+
     def update_selection_rectangle(self):
         """Update the selection rectangle based on current drag positions."""
         if not self.is_dragging:
@@ -659,10 +1255,11 @@ class ScreenshotOverlay(QWidget):
         # Convert to global screen coordinates to QRect
         self.selection_rect = QRect(left, top, right - left, bottom - top)
 
-        logger.debug(
-            f"Selection rectangle updated: {self.selection_rect.width()}x{self.selection_rect.height()} "
-            f"at ({self.selection_rect.x()}, {self.selection_rect.y()})"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Selection rectangle updated: {self.selection_rect.width()}x{self.selection_rect.height()} "
+                f"at ({self.selection_rect.x()}, {self.selection_rect.y()})"
+            )
 
     @pyqtProperty(float)
     def overlay_opacity(self) -> float:
@@ -671,9 +1268,22 @@ class ScreenshotOverlay(QWidget):
 
     @overlay_opacity.setter
     def overlay_opacity(self, value: float):
-        """Set the overlay opacity and trigger a repaint."""
+        """Set the overlay opacity and schedule a full repaint."""
+        if value == self._overlay_opacity:
+            return
         self._overlay_opacity = value
-        self.update()  # Trigger paintEvent
+        self._dimmed_screen = None  # Rebuilt at the new opacity on next paint
+        if self._captured_screen_pixmaps:
+            # The capture-time dimmed pixmap is stale too - a later resize must not restore it
+            self._captured_screen_pixmaps = (self._captured_screen_pixmaps[0], None)
+
+        # Animated changes are coalesced with mouse repaints to one per frame
+        self._dirty_region = QRegion(self.rect())
+        if self._repaint_timer:
+            if not self._repaint_timer.isActive():
+                self._repaint_timer.start()
+        else:
+            self._flush_repaint()
 
     def keyPressEvent(self, event: QKeyEvent):
         """Handle key press events."""
@@ -689,25 +1299,48 @@ class ScreenshotOverlay(QWidget):
             super().keyPressEvent(event)
 
     def mouseMoveEvent(self, event):
-        """Handle mouse move events for window highlighting and drag selection."""
+        """Handle mouse move events - record the position, processed once per frame."""
+        # Convert local coordinates to global screen coordinates
+        self._pending_move_pos = event.position().toPoint() + self._global_origin
+        if self._move_timer is None:
+            self._flush_mouse_move()
+        elif not self._move_timer.isActive():
+            self._move_timer.start()
+
+        super().mouseMoveEvent(event)
+
+    def _flush_mouse_move(self):
+        """Process the latest mouse move for window highlighting and drag selection."""
+        if self._pending_move_pos is None:
+            return
+        global_pos = self._pending_move_pos
+        self._pending_move_pos = None
+
         # Performance timing to detect slow mouse handlers
         mouse_start = time.perf_counter()
 
-        # Convert local coordinates to global screen coordinates
-        global_pos = self.mapToGlobal(event.position().toPoint())
-
         # Always update cursor position for crosshair guidelines
-        self.cursor_x = global_pos.x()
-        self.cursor_y = global_pos.y()
+        x = global_pos.x()
+        y = global_pos.y()
+        self.cursor_x = x
+        self.cursor_y = y
 
-        logger.debug(f"[MOUSE] Move event at ({self.cursor_x}, {self.cursor_y}), pressed={self.mouse_pressed}, dragging={self.is_dragging}")
+        # Overlay isn't interactive while fading in - _on_fade_in_finished catches up
+        if (
+            not self.mouse_pressed
+            and self.fade_animation
+            and self.fade_animation.state() == QPropertyAnimation.State.Running
+        ):
+            return
+
+        if logger.isEnabledFor(logging.DEBUG):
+            # Guarded so the message isn't formatted on every move when debug logging is off
+            logger.debug(f"[MOUSE] Move event at ({self.cursor_x}, {self.cursor_y}), pressed={self.mouse_pressed}, dragging={self.is_dragging}")
 
         # Check if this might be the start of a drag operation
         if self.mouse_pressed and not self.is_dragging:
-            current_pos = (global_pos.x(), global_pos.y())
-            distance_moved = abs(current_pos[0] - self.press_position[0]) + abs(
-                current_pos[1] - self.press_position[1]
-            )
+            press_x, press_y = self.press_position
+            distance_moved = abs(x - press_x) + abs(y - press_y)
 
             if distance_moved >= self.drag_threshold_px:
                 logger.info(
@@ -719,46 +1352,54 @@ class ScreenshotOverlay(QWidget):
 
         # Always update magnifier position during cursor movement
         if self.magnifier and self.frozen_screen:
-            self.magnifier.set_source_image(self.frozen_screen)
-            self.magnifier.update_cursor_position(global_pos.x(), global_pos.y())
-            self.magnifier.show_magnifier()
+            self.magnifier.update_cursor_position(x, y)
+            if not self.magnifier.is_visible:
+                self.magnifier.show_magnifier()
 
         # Handle active dragging
         if self.is_dragging:
-            current_pos = (global_pos.x(), global_pos.y())
-            self.current_drag_pos = current_pos
+            # Sub-pixel jitter reports the same position - selection is unchanged
+            drag_x, drag_y = self.current_drag_pos
+            if x != drag_x or y != drag_y or self.selection_rect is None:
+                self.current_drag_pos = (x, y)
 
-            # Update selection rectangle
-            self.update_selection_rectangle()
+                # Update selection rectangle
+                self.update_selection_rectangle()
 
-            # Trigger repaint to show selection rectangle and crosshair guidelines
-            self.update()
+                # Schedule repaint to show selection rectangle and crosshair guidelines
+                self._request_repaint()
         else:
             # Update window highlighting when not dragging
-            self.update_window_highlight(global_pos.x(), global_pos.y())
+            self.update_window_highlight(x, y)
 
         # Update crosshair guidelines if cursor moved (reduce repaint frequency)
         current_crosshair_pos = (self.cursor_x, self.cursor_y)
         if current_crosshair_pos != self.last_crosshair_pos:
             self.last_crosshair_pos = current_crosshair_pos
-            self.update()  # Repaint for crosshair guidelines
+            self._request_repaint()  # Repaint for crosshair guidelines
+
+        # Moves already arrive at most once per frame - repaint now rather than a frame later
+        if self._repaint_timer:
+            self._repaint_timer.stop()
+        self._flush_repaint()
 
         # Log if mouse event handling was slow
         mouse_time = time.perf_counter() - mouse_start
         if mouse_time > 0.050:
             logger.warning(f"[PERF] mouseMoveEvent took {mouse_time*1000:.1f}ms - potential hang risk!")
         elif mouse_time > 0.016:
-            logger.debug(f"[PERF] mouseMoveEvent took {mouse_time*1000:.1f}ms")
-
-        super().mouseMoveEvent(event)
+            logger.debug("[PERF] mouseMoveEvent took %.1fms", mouse_time * 1000)
 
     def mousePressEvent(self, event: QMouseEvent):
         """Handle mouse press events - start of click or drag."""
         logger.debug(f"[MOUSE] Press event: button={event.button()}")
 
+        # Catch up on a throttled move so the highlight matches the press position
+        self._flush_mouse_move()
+
         if event.button() == Qt.MouseButton.LeftButton:
             # Convert to global coordinates
-            global_pos = self.mapToGlobal(event.position().toPoint())
+            global_pos = event.position().toPoint() + self._global_origin
 
             # Record press details
             self.mouse_pressed = True
@@ -782,19 +1423,22 @@ class ScreenshotOverlay(QWidget):
 
     def mouseReleaseEvent(self, event: QMouseEvent):
         """Handle mouse release events - complete click or end drag."""
+        self._flush_mouse_move()
+
         # Handle right-click to toggle window preview mode
         if event.button() == Qt.MouseButton.RightButton:
             self.is_preview_mode_enabled = not self.is_preview_mode_enabled
             logger.info(
                 f"Window preview mode toggled to: {'ON' if self.is_preview_mode_enabled else 'OFF'}"
             )
-            self.update()  # Trigger a repaint to reflect the new state
+            # Only the highlighted window's area shows the preview
+            self.update(self._get_decoration_region())
             return
 
         # Handle left-click events (existing logic)
         if event.button() == Qt.MouseButton.LeftButton and self.mouse_pressed:
             # Convert to global coordinates
-            global_pos = self.mapToGlobal(event.position().toPoint())
+            global_pos = event.position().toPoint() + self._global_origin
             current_pos = (global_pos.x(), global_pos.y())
 
             # Calculate click duration and movement
@@ -856,36 +1500,21 @@ class ScreenshotOverlay(QWidget):
                         True  # track window movement
                     )
                     self.close()
-                elif target_window_id in self.captured_windows:
+                elif self._wait_for_window_capture(self.highlighted_window):
                     # Screenshot mode: use pre-captured window content
                     captured_window = self.captured_windows[target_window_id]
                     logger.debug(
                         f"Window click detected on: {captured_window.window_info.title}"
                     )
 
-                    if captured_window.image:
-                        # Screenshot mode: capture and save
-                        # Use pre-captured window content and existing save infrastructure
-                        try:
-                            filepath, file_size = self.capture_system.save_screenshot(
-                                captured_window.image, capture_type="win"
-                            )
-                            # Copy to clipboard
-                            if copy_image_to_clipboard(filepath):
-                                logger.info(
-                                    f"Window capture completed: {captured_window.window_info.title} ({file_size} bytes)"
-                                )
-                            else:
-                                logger.warning(
-                                    "Failed to copy window capture to clipboard"
-                                )
-                            # Show notification with sound
-                            try:
-                                notify_screenshot_saved(filepath, file_size)
-                            except Exception as e:
-                                logger.warning(f"Failed to show notification: {e}")
-                        except (OSError, IOError, PermissionError) as e:
-                            logger.error(f"Failed to save window capture for '{captured_window.window_info.title}': {e}")
+                    window_image = self.get_window_image(captured_window)
+                    if window_image:
+                        # Screenshot mode: save on a pool thread so the overlay closes at once
+                        self._save_screenshot_async(
+                            window_image,
+                            "win",
+                            f"Window capture '{captured_window.window_info.title}'",
+                        )
                         self.close()
                     else:
                         logger.warning(
@@ -908,6 +1537,16 @@ class ScreenshotOverlay(QWidget):
             logger.error(f"Error in handle_single_click: {e}")
             self.close()
 
+    def _save_screenshot_async(
+        self, image: Image.Image, capture_type: str, description: str, bgra: bool = False
+    ):
+        """Hand a finished screenshot to the global thread pool for save/clipboard/notify.
+
+        ScreenshotUI.run waits for the pool before the process exits.
+        """
+        task = SaveScreenshotTask(self.capture_system, image, capture_type, description, bgra)
+        QThreadPool.globalInstance().start(task)
+
     def _capture_desktop(self):
         """Helper method to capture desktop using frozen image."""
         if self.video_mode:
@@ -926,24 +1565,12 @@ class ScreenshotOverlay(QWidget):
         else:
             # Screenshot mode: capture desktop
             logger.info("Desktop click detected - capturing full screen")
-            if self.frozen_full_image:
-                # Use pre-captured desktop content and existing save infrastructure
-                try:
-                    filepath, file_size = self.capture_system.save_screenshot(
-                        self.frozen_full_image, capture_type="full"
-                    )
-                    # Copy to clipboard
-                    if copy_image_to_clipboard(filepath):
-                        logger.info(f"Full desktop capture completed ({file_size} bytes)")
-                    else:
-                        logger.warning("Failed to copy desktop capture to clipboard")
-                    # Show notification with sound
-                    try:
-                        notify_screenshot_saved(filepath, file_size)
-                    except Exception as e:
-                        logger.warning(f"Failed to show notification: {e}")
-                except (OSError, IOError, PermissionError) as e:
-                    logger.error(f"Failed to save desktop capture: {e}")
+            frozen_image = self._get_frozen_image()
+            if frozen_image:
+                # Use pre-captured desktop content; saved on a pool thread
+                self._save_screenshot_async(
+                    frozen_image, "full", "Full desktop capture", self._frozen_image_is_bgra
+                )
             else:
                 logger.error("No frozen desktop image available")
 
@@ -985,33 +1612,17 @@ class ScreenshotOverlay(QWidget):
                 )
                 self.close()
             else:
-                # Screenshot mode: capture and save
-                # Use pre-captured desktop content for cropping
-                if self.frozen_full_image:
-                    # Crop the selected area from frozen image
-                    # Add 1 pixel to right and bottom to include the current selected pixel
-                    try:
-                        cropped_image = self.frozen_full_image.crop(
-                            (left, top, right + 1, bottom + 1)
-                        )
-                        # Use existing save infrastructure
-                        filepath, file_size = self.capture_system.save_screenshot(
-                            cropped_image, capture_type="area"
-                        )
-                        # Copy to clipboard
-                        if copy_image_to_clipboard(filepath):
-                            logger.info(
-                                f"Area capture completed: {width}x{height} pixels ({file_size} bytes)"
-                            )
-                        else:
-                            logger.warning("Failed to copy area capture to clipboard")
-                        # Show notification with sound
-                        try:
-                            notify_screenshot_saved(filepath, file_size)
-                        except Exception as e:
-                            logger.warning(f"Failed to show notification: {e}")
-                    except (OSError, IOError, PermissionError) as e:
-                        logger.error(f"Failed to save area capture ({width}x{height} pixels): {e}")
+                # Screenshot mode: crop the selected area from the pre-captured desktop
+                # Add 1 pixel to right and bottom to include the current selected pixel
+                cropped_image = self._get_frozen_image((left, top, right + 1, bottom + 1))
+                if cropped_image:
+                    # Encoding and saving happen on a pool thread
+                    self._save_screenshot_async(
+                        cropped_image,
+                        "area",
+                        f"Area capture ({width}x{height} pixels)",
+                        self._frozen_image_is_bgra,
+                    )
                 else:
                     logger.error("No frozen desktop image available for area capture")
 
@@ -1021,83 +1632,97 @@ class ScreenshotOverlay(QWidget):
             logger.error(f"Error in handle_drag_complete: {e}")
             self.close()
 
-    def _draw_background(self, painter: QPainter):
-        """Draw the overlay background (frozen screenshot, transparent, or fallback)."""
-        if self.frozen_screen:
-            painter.drawPixmap(self.rect(), self.frozen_screen, self.frozen_screen.rect())
-            logger.debug("Frozen screen background drawn")
+    def _get_dark_overlay_color(self) -> QColor:
+        """Get the dark overlay color at the current overlay opacity."""
+        self._dark_overlay_color.setAlpha(int(self._overlay_opacity * 255))
+        return self._dark_overlay_color
+
+    def _get_dimmed_screen(self) -> Optional[QPixmap]:
+        """Get the frozen screen with the dark overlay pre-applied.
+
+        Normally precomputed in capture_frozen_screen; rebuilt here once if the
+        overlay opacity has changed since. Drawing the frozen screen at reduced
+        opacity over black darkens it in a single blend pass.
+        """
+        if self._dimmed_screen is None and self.frozen_screen:
+            dimmed_screen = QPixmap(self.frozen_screen.size())
+            dimmed_screen.fill(Qt.GlobalColor.black)
+            painter = QPainter(dimmed_screen)
+            painter.setOpacity(1.0 - self._overlay_opacity)
+            painter.drawPixmap(0, 0, self.frozen_screen)
+            painter.end()
+            self._dimmed_screen = dimmed_screen
+            logger.debug(f"Dimmed screen cache built ({self._overlay_opacity:.1%} opacity)")
+        return self._dimmed_screen
+
+    def _draw_screen_pixmap(self, painter: QPainter, pixmap: QPixmap, target_rect: QRect):
+        """Draw the part of a screen-sized pixmap that falls inside target_rect."""
+        if pixmap.size() == self._overlay_rect.size():
+            # 1:1 mapping - only blit the target area (the point overload never scales)
+            painter.drawPixmap(target_rect.topLeft(), pixmap, target_rect)
+        else:
+            painter.save()
+            painter.setClipRect(target_rect, Qt.ClipOperation.IntersectClip)
+            painter.drawPixmap(self._overlay_rect, pixmap, pixmap.rect())
+            painter.restore()
+
+    def _draw_background(self, painter: QPainter, dirty_rect: QRect):
+        """Draw the overlay background (dimmed or frozen screenshot, transparent, or fallback)."""
+        dimmed_screen = self._get_dimmed_screen()
+        if dimmed_screen:
+            # Dark overlay is already baked in - exclusion is restored from frozen_screen later
+            self._draw_screen_pixmap(painter, dimmed_screen, dirty_rect)
+        elif self.frozen_screen:
+            self._draw_screen_pixmap(painter, self.frozen_screen, dirty_rect)
         elif self.video_mode:
             # Video mode: fully transparent background to show live desktop
-            painter.fillRect(self.rect(), QColor(0, 0, 0, 0))
+            painter.fillRect(dirty_rect, CaptiXColors.TRANSPARENT)
         else:
-            painter.fillRect(self.rect(), QColor(128, 128, 128, 50))
-            logger.warning("No frozen screen available, using fallback background")
+            # Opaque window - the fallback must cover the unerased area itself
+            painter.fillRect(dirty_rect, CaptiXColors.FALLBACK_GRAY)
+            if not self._warned_no_frozen_screen:
+                # Once per overlay, not on every repaint
+                logger.warning("No frozen screen available, using fallback background")
+                self._warned_no_frozen_screen = True
 
     def _calculate_exclusion_rect(self) -> Optional[QRect]:
         """Calculate area to exclude from dark overlay (selection or highlighted window)."""
         if self.selection_rect and self.is_dragging:
             return self.selection_rect
         elif self.highlighted_window and not self.highlighted_window.is_root and not self.is_dragging:
-            if self.highlighted_window.window_id in self.captured_windows:
-                window_geometry = self.captured_windows[self.highlighted_window.window_id].geometry
-            else:
-                window_geometry = self._get_window_content_geometry(self.highlighted_window)
-            return window_geometry.intersected(self.rect())
+            # Same visible rect the highlight is drawn at (cached per target)
+            return self._get_highlight_layout(self.highlighted_window)[0]
         return None
 
-    def _draw_overlay_around_exclusion(self, painter: QPainter, color: QColor, exclusion_rect: QRect):
-        """Draw overlay in 4 regions around the exclusion rectangle."""
-        screen_rect = self.rect()
-
-        # Top region (above exclusion)
-        if exclusion_rect.top() > screen_rect.top():
-            top_rect = QRect(
-                screen_rect.left(),
-                screen_rect.top(),
-                screen_rect.width(),
-                exclusion_rect.top() - screen_rect.top(),
-            )
-            painter.fillRect(top_rect, color)
-
-        # Bottom region (below exclusion)
-        if exclusion_rect.bottom() < screen_rect.bottom():
-            bottom_rect = QRect(
-                screen_rect.left(),
-                exclusion_rect.bottom(),
-                screen_rect.width(),
-                screen_rect.bottom() - exclusion_rect.bottom(),
-            )
-            painter.fillRect(bottom_rect, color)
-
-        # Left region (left of exclusion)
-        if exclusion_rect.left() > screen_rect.left():
-            left_rect = QRect(
-                screen_rect.left(),
-                max(screen_rect.top(), exclusion_rect.top()),
-                exclusion_rect.left() - screen_rect.left(),
-                min(screen_rect.bottom(), exclusion_rect.bottom())
-                - max(screen_rect.top(), exclusion_rect.top()),
-            )
-            painter.fillRect(left_rect, color)
-
-        # Right region (right of exclusion)
-        if exclusion_rect.right() < screen_rect.right():
-            right_rect = QRect(
-                exclusion_rect.right(),
-                max(screen_rect.top(), exclusion_rect.top()),
-                screen_rect.right() - exclusion_rect.right(),
-                min(screen_rect.bottom(), exclusion_rect.bottom())
-                - max(screen_rect.top(), exclusion_rect.top()),
-            )
-            painter.fillRect(right_rect, color)
+    def _draw_overlay_around_exclusion(
+        self, painter: QPainter, color: QColor, exclusion_rect: QRect, dirty_rect: QRect
+    ):
+        """Draw overlay over the dirty area except the exclusion rectangle."""
+        # Let the paint engine cut the hole instead of filling bands around it
+        outside_region = QRegion(dirty_rect).subtracted(QRegion(exclusion_rect))
+        painter.save()
+        painter.setClipRegion(outside_region, Qt.ClipOperation.IntersectClip)
+        self._fill_dark_overlay(painter, dirty_rect, color)
+        painter.restore()
+
+    def _fill_dark_overlay(self, painter: QPainter, rect: QRect, color: QColor):
+        """Fill an area with the dark overlay color.
+
+        In video mode the background is fully transparent, so blending the color
+        over it yields the color itself - Source composition writes it directly
+        and skips the per-pixel blend.
+        """
+        if self.video_mode and not self.frozen_screen:
+            previous_mode = painter.compositionMode()
+            painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+            painter.fillRect(rect, color)
+            painter.setCompositionMode(previous_mode)
+        else:
+            painter.fillRect(rect, color)
 
     def _draw_selection_border(self, painter: QPainter):
         """Draw selection border based on drag direction."""
-        pen = painter.pen()
-        pen.setColor(CaptiXColors.THEME_BLUE)
-        pen.setWidth(UIConstants.HIGHLIGHT_BORDER_WIDTH)
-        pen.setStyle(Qt.PenStyle.DashDotLine)
-        painter.setPen(pen)
+        painter.setPen(self._border_pen)
 
         # Get selection rectangle bounds
         left = self.selection_rect.left()
@@ -1109,47 +1734,62 @@ class ScreenshotOverlay(QWidget):
         origin_x, origin_y = self.press_position
         cursor_x, cursor_y = self.cursor_x, self.cursor_y
 
-        # Draw borders based on drag direction
+        # Draw borders based on drag direction (batched into one call)
+        border_lines = []
         if cursor_y < origin_y:
-            painter.drawLine(left, bottom, right, bottom)
+            border_lines.append(QLine(left, bottom, right, bottom))
         if cursor_y > origin_y:
-            painter.drawLine(left, top, right, top)
+            border_lines.append(QLine(left, top, right, top))
         if cursor_x < origin_x:
-            painter.drawLine(right, top, right, bottom)
+            border_lines.append(QLine(right, top, right, bottom))
         if cursor_x > origin_x:
-            painter.drawLine(left, top, left, bottom)
+            border_lines.append(QLine(left, top, left, bottom))
+        if border_lines:
+            painter.drawLines(border_lines)
 
         # Draw dimensions display
         self.draw_selection_dimensions(painter)
 
         logger.debug(
-            f"Selection rectangle drawn: {self.selection_rect.width()}x{self.selection_rect.height()} "
-            f"at ({self.selection_rect.x()}, {self.selection_rect.y()})"
+            "Selection rectangle drawn: %dx%d at (%d, %d)",
+            self.selection_rect.width(),
+            self.selection_rect.height(),
+            self.selection_rect.x(),
+            self.selection_rect.y(),
         )
 
-    def _draw_dark_overlay_with_selection(self, painter: QPainter):
+    def _draw_dark_overlay_with_selection(self, painter: QPainter, dirty_rect: QRect):
         """Draw dark overlay everywhere except selection/highlighted window, and draw selection border."""
         # Calculate alpha and color
         alpha_value = int(self._overlay_opacity * 255)
-        dark_overlay_color = CaptiXColors.DARK_OVERLAY_BLACK
-        dark_overlay_color.setAlpha(alpha_value)
+        dark_overlay_color = self._get_dark_overlay_color()
 
         # Determine exclusion rectangle
         exclusion_rect = self._calculate_exclusion_rect()
 
         if exclusion_rect and not exclusion_rect.isEmpty():
-            # Draw overlay in 4 regions around exclusion
-            self._draw_overlay_around_exclusion(painter, dark_overlay_color, exclusion_rect)
+            if self._dimmed_screen:
+                # Background is already dimmed - restore the bright frozen screen in the exclusion
+                bright_rect = exclusion_rect.intersected(dirty_rect)
+                if not bright_rect.isEmpty():
+                    self._draw_screen_pixmap(painter, self.frozen_screen, bright_rect)
+            else:
+                # Draw overlay around the exclusion
+                self._draw_overlay_around_exclusion(painter, dark_overlay_color, exclusion_rect, dirty_rect)
 
             # Draw selection border if dragging
             if self.selection_rect and self.is_dragging:
                 self._draw_selection_border(painter)
-        else:
-            # No exclusion - draw overlay over entire screen
-            painter.fillRect(self.rect(), dark_overlay_color)
+        elif not self._dimmed_screen:
+            # No exclusion - draw overlay over the whole dirty area
+            self._fill_dark_overlay(painter, dirty_rect, dark_overlay_color)
 
         if alpha_value > 0:
-            logger.debug(f"Dark overlay layer drawn ({self._overlay_opacity:.1%} opacity, alpha={alpha_value})")
+            logger.debug(
+                "Dark overlay layer drawn (%.1f%% opacity, alpha=%d)",
+                self._overlay_opacity * 100,
+                alpha_value,
+            )
 
     def paintEvent(self, event: QPaintEvent):
         """Paint the overlay with background, dark overlay, selection rectangle, and window highlight."""
@@ -1157,15 +1797,23 @@ class ScreenshotOverlay(QWidget):
         paint_start = time.perf_counter()
 
         painter = QPainter(self)
+        # Everything drawn is axis-aligned at integer coordinates - keep the
+        # aliased raster paths regardless of platform/style defaults
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, False)
+
+        # Only the dirty area needs repainting
+        dirty_rect = event.rect()
+        painter.setClipRect(dirty_rect)
 
         # Draw background
         bg_start = time.perf_counter()
-        self._draw_background(painter)
+        self._draw_background(painter, dirty_rect)
         bg_time = time.perf_counter() - bg_start
 
         # Draw dark overlay with exclusion logic
         overlay_start = time.perf_counter()
-        self._draw_dark_overlay_with_selection(painter)
+        self._draw_dark_overlay_with_selection(painter, dirty_rect)
         overlay_time = time.perf_counter() - overlay_start
 
         # Draw window highlight (only when not dragging)
@@ -1183,7 +1831,7 @@ class ScreenshotOverlay(QWidget):
 
         # Draw crosshair guidelines
         crosshair_start = time.perf_counter()
-        self.draw_crosshair_guidelines(painter)
+        self.draw_crosshair_guidelines(painter, dirty_rect)
         crosshair_time = time.perf_counter() - crosshair_start
 
         # Log performance if paint took too long (>50ms could indicate issues)
@@ -1196,29 +1844,64 @@ class ScreenshotOverlay(QWidget):
             )
         elif total_time > 0.016:  # More than one frame at 60fps
             logger.debug(
-                f"[PERF] paintEvent took {total_time*1000:.1f}ms "
-                f"(bg:{bg_time*1000:.1f}ms, overlay:{overlay_time*1000:.1f}ms, "
-                f"highlight:{highlight_time*1000:.1f}ms, crosshair:{crosshair_time*1000:.1f}ms)"
+                "[PERF] paintEvent took %.1fms "
+                "(bg:%.1fms, overlay:%.1fms, highlight:%.1fms, crosshair:%.1fms)",
+                total_time * 1000,
+                bg_time * 1000,
+                overlay_time * 1000,
+                highlight_time * 1000,
+                crosshair_time * 1000,
             )
 
-    def draw_window_highlight(self, painter: QPainter):
-        """Draw highlight overlay over the currently highlighted window."""
-        window = self.highlighted_window
-        if not window:
-            return
+    def _get_highlight_layout(self, window: WindowInfo) -> tuple:
+        """Get the on-screen rect and captured-image source rect for a highlighted window.
+
+        Cached until the highlight target changes or its capture arrives, since
+        the uncaptured fallback queries X for the window's frame extents.
+
+        Returns:
+            Tuple of (visible window rect, source rect or None if not captured yet)
+        """
+        captured_window = self.captured_windows.get(window.window_id)
+        key = (window.window_id, captured_window is not None)
+        if self._highlight_layout and self._highlight_layout[0] == key:
+            return self._highlight_layout[1], self._highlight_layout[2]
 
         # Use captured window geometry if available (content-only, borders excluded)
         # Otherwise calculate content-only geometry immediately using border detection
-        if window.window_id in self.captured_windows:
-            original_window_rect = self.captured_windows[window.window_id].geometry
+        if captured_window:
+            original_window_rect = captured_window.geometry
         else:
-            # Calculate content-only geometry immediately using border detection
             original_window_rect = self._get_window_content_geometry(window)
 
         # Calculate visible portion within screen bounds
-        screen_rect = self.rect()
-        visible_window_rect = original_window_rect.intersected(screen_rect)
+        visible_window_rect = original_window_rect.intersected(self._overlay_rect)
+
+        source_rect = None
+        if captured_window:
+            # Calculate which part of the captured image to show
+            # This prevents squishing when window is partially off-screen
+            source_rect = QRect(
+                visible_window_rect.x() - original_window_rect.x(),
+                visible_window_rect.y() - original_window_rect.y(),
+                visible_window_rect.width(),
+                visible_window_rect.height(),
+            )
+            # Ensure source rectangle is within the captured image bounds
+            source_rect = source_rect.intersected(
+                QRect(0, 0, original_window_rect.width(), original_window_rect.height())
+            )
 
+        self._highlight_layout = (key, visible_window_rect, source_rect)
+        return visible_window_rect, source_rect
+
+    def draw_window_highlight(self, painter: QPainter):
+        """Draw highlight overlay over the currently highlighted window."""
+        window = self.highlighted_window
+        if not window:
+            return
+
+        visible_window_rect, source_rect = self._get_highlight_layout(window)
         if visible_window_rect.isEmpty():
             return
 
@@ -1228,129 +1911,134 @@ class ScreenshotOverlay(QWidget):
             # Try to show actual captured window content instead of gray overlay
             window_pixmap = self.get_window_qpixmap(window.window_id)
 
-            if window_pixmap:
-                # Calculate which part of the captured image to show
-                # This prevents squishing when window is partially off-screen
-
-                # Calculate offset from window origin to visible area
-                offset_x = visible_window_rect.x() - original_window_rect.x()
-                offset_y = visible_window_rect.y() - original_window_rect.y()
-
-                # Create source rectangle (portion of captured image to display)
-                source_rect = QRect(
-                    offset_x,
-                    offset_y,
-                    visible_window_rect.width(),
-                    visible_window_rect.height(),
-                )
-
-                # Ensure source rectangle is within pixmap bounds
-                source_rect = source_rect.intersected(window_pixmap.rect())
-
-                if not source_rect.isEmpty():
-                    # Draw only the visible portion - no squishing
-                    painter.drawPixmap(visible_window_rect, window_pixmap, source_rect)
+            if window_pixmap and source_rect is not None and not source_rect.isEmpty():
+                # Draw only the visible portion - the point overload never scales,
+                # so this is always a 1:1 blit (no squishing)
+                if source_rect == window_pixmap.rect():
+                    painter.drawPixmap(visible_window_rect.topLeft(), window_pixmap)
+                else:
+                    painter.drawPixmap(visible_window_rect.topLeft(), window_pixmap, source_rect)
         # else: Preview OFF - don't draw window content, only border will be drawn below
 
         # Always draw border for clarity (both modes)
-        pen = painter.pen()
-        pen.setColor(CaptiXColors.THEME_BLUE)  # Blue border that stands out better
-        pen.setWidth(UIConstants.HIGHLIGHT_BORDER_WIDTH)  # 2 pixel width for better visibility over any content
-        pen.setStyle(Qt.PenStyle.DashDotLine)  # Dash-dot style to match guidelines
-        painter.setPen(pen)
+        painter.setPen(self._border_pen)
         painter.drawRect(visible_window_rect)
 
         logger.debug(
-            f"Window {'content preview' if self.is_preview_mode_enabled else 'border highlight'} drawn: "
-            f"{visible_window_rect.width()}x{visible_window_rect.height()} "
-            f"at ({visible_window_rect.x()}, {visible_window_rect.y()}) - {window.title}"
+            "Window %s drawn: %dx%d at (%d, %d) - %s",
+            "content preview" if self.is_preview_mode_enabled else "border highlight",
+            visible_window_rect.width(),
+            visible_window_rect.height(),
+            visible_window_rect.x(),
+            visible_window_rect.y(),
+            window.title,
         )
 
-    def draw_crosshair_guidelines(self, painter: QPainter):
+    def draw_crosshair_guidelines(self, painter: QPainter, dirty_rect: QRect):
         """Draw dash-dot guidelines from cursor to screen edges for precision targeting.
 
         The actual crosshair cursor is provided by Qt.CursorShape.CrossCursor.
         This method only draws the guideline extensions to screen edges.
+        They are skipped during a drag, where the selection border takes over.
         """
+        if self.is_dragging:
+            return
+
         # Only draw guidelines if we have cursor position and overlay is visible
         if self._overlay_opacity <= 0:
             return
 
-        screen_rect = self.rect()
+        screen_rect = self._overlay_rect
         cursor_x = self.cursor_x
         cursor_y = self.cursor_y
 
-        # Configure pen for dash-dot guidelines
-        pen = painter.pen()
-        pen.setColor(CaptiXColors.THEME_BLUE)  # Same blue as window highlight
-        pen.setWidth(
-            UIConstants.HIGHLIGHT_BORDER_WIDTH
-        )  # Thicker lines for better visibility (matches window border width)
-        pen.setStyle(Qt.PenStyle.DashDotLine)  # Dash-dot style
-        painter.setPen(pen)
+        # Dash-dot guidelines, same style as the window highlight
+        pen_width = UIConstants.HIGHLIGHT_BORDER_WIDTH
+        pen = self._guideline_pen
+
+        # Only stroke the part of each guideline inside the dirty area (plus the
+        # pen's reach). The dash offset (in pen widths) keeps the pattern aligned
+        # with a full screen-length line so partial repaints join up seamlessly.
+        paint_rect = dirty_rect.adjusted(-pen_width, -pen_width, pen_width, pen_width)
 
         # Draw horizontal guideline (left to right across full screen)
-        painter.drawLine(screen_rect.left(), cursor_y, screen_rect.right(), cursor_y)
+        if paint_rect.top() <= cursor_y <= paint_rect.bottom():
+            x1 = max(screen_rect.left(), paint_rect.left())
+            x2 = min(screen_rect.right(), paint_rect.right())
+            pen.setDashOffset((x1 - screen_rect.left()) / pen_width)
+            painter.setPen(pen)
+            painter.drawLine(x1, cursor_y, x2, cursor_y)
 
         # Draw vertical guideline (top to bottom across full screen)
-        painter.drawLine(cursor_x, screen_rect.top(), cursor_x, screen_rect.bottom())
+        if paint_rect.left() <= cursor_x <= paint_rect.right():
+            y1 = max(screen_rect.top(), paint_rect.top())
+            y2 = min(screen_rect.bottom(), paint_rect.bottom())
+            pen.setDashOffset((y1 - screen_rect.top()) / pen_width)
+            painter.setPen(pen)
+            painter.drawLine(cursor_x, y1, cursor_x, y2)
 
-        logger.debug(
-            f"Crosshair guidelines drawn at cursor position ({cursor_x}, {cursor_y})"
-        )
+        logger.debug("Crosshair guidelines drawn at cursor position (%d, %d)", cursor_x, cursor_y)
 
-    def draw_selection_dimensions(self, painter: QPainter):
-        """Draw selection dimensions anchored to bottom-right corner of selection."""
+    def _get_selection_dimensions_layout(self):
+        """Calculate the dimensions label layout for the current selection.
+
+        Returns:
+            Tuple of (background rect, text), or (None, None) if there is no selection
+        """
         if not self.selection_rect or self.selection_rect.isEmpty():
-            return
+            return None, None
 
-        # Get selection dimensions
-        width = self.selection_rect.width()
-        height = self.selection_rect.height()
+        # Both the repaint request and the paint ask for the layout of the same selection
+        if self._dimensions_layout and self._dimensions_layout[0] == self.selection_rect:
+            return self._dimensions_layout[1], self._dimensions_layout[2]
 
         # Format dimensions text
-        dimensions_text = f"{width} × {height}"
-
-        # Set up font and calculate text size
-        from PyQt6.QtGui import QFont, QFontMetrics
+        dimensions_text = f"{self.selection_rect.width()} × {self.selection_rect.height()}"
 
-        font = QFont("Arial", 12, QFont.Weight.Bold)  # Smaller font size
-        painter.setFont(font)
-        font_metrics = QFontMetrics(font)
-        text_rect = font_metrics.boundingRect(dimensions_text)
+        # Calculate text size
+        text_rect = self._dimensions_font_metrics.boundingRect(dimensions_text)
 
         # Add padding around text
         padding = UIConstants.DIMENSIONS_DISPLAY_PADDING  # Smaller padding
         text_bg_width = text_rect.width() + (padding * 2)
         text_bg_height = text_rect.height() + (padding * 2)
 
-        # Position at bottom-right corner of selection, inside the selection area
-        selection_bottom_right_x = self.selection_rect.right()
-        selection_bottom_right_y = self.selection_rect.bottom()
-
-        # Anchor to bottom-right, inside selection
-        bg_x = selection_bottom_right_x - text_bg_width - UIConstants.DIMENSIONS_DISPLAY_MARGIN  # 10px margin from edge
-        bg_y = selection_bottom_right_y - text_bg_height - UIConstants.DIMENSIONS_DISPLAY_MARGIN  # 10px margin from edge
+        # Anchor to bottom-right corner of selection, inside the selection area
+        bg_x = self.selection_rect.right() - text_bg_width - UIConstants.DIMENSIONS_DISPLAY_MARGIN  # 10px margin from edge
+        bg_y = self.selection_rect.bottom() - text_bg_height - UIConstants.DIMENSIONS_DISPLAY_MARGIN  # 10px margin from edge
 
-        # Create background rectangle
         bg_rect = QRect(bg_x, bg_y, text_bg_width, text_bg_height)
+        self._dimensions_layout = (QRect(self.selection_rect), bg_rect, dimensions_text)
+        return bg_rect, dimensions_text
+
+    def draw_selection_dimensions(self, painter: QPainter):
+        """Draw selection dimensions anchored to bottom-right corner of selection."""
+        bg_rect, dimensions_text = self._get_selection_dimensions_layout()
+        if not bg_rect:
+            return
+
+        painter.setFont(self._dimensions_font)
 
         # Draw semi-transparent background
         painter.fillRect(bg_rect, CaptiXColors.SEMI_TRANSPARENT_BLACK)  # Dark background
 
         # Draw the dimensions text (no border)
-        text_pen = painter.pen()
-        text_pen.setColor(CaptiXColors.WHITE_TEXT)  # White text
-        text_pen.setWidth(1)
-        painter.setPen(text_pen)
+        painter.setPen(self._text_pen)
+
+        # Re-layout the glyph run only when the label changes
+        if dimensions_text != self._dimensions_last_text:
+            self._dimensions_static_text.setText(dimensions_text)
+            self._dimensions_static_text.prepare(QTransform(), self._dimensions_font)
+            self._dimensions_last_text = dimensions_text
 
-        # Center text within background rectangle
-        text_x = bg_x + padding
-        text_y = bg_y + padding + font_metrics.ascent()
-        painter.drawText(text_x, text_y, dimensions_text)
+        # Center text within background rectangle (static text is positioned by its top-left)
+        padding = UIConstants.DIMENSIONS_DISPLAY_PADDING
+        text_x = bg_rect.x() + padding
+        text_y = bg_rect.y() + padding
+        painter.drawStaticText(text_x, text_y, self._dimensions_static_text)
 
         logger.debug(
-            f"Selection dimensions displayed: {dimensions_text} at ({bg_x}, {bg_y})"
+            "Selection dimensions displayed: %s at (%d, %d)", dimensions_text, bg_rect.x(), bg_rect.y()
         )
 
     def _get_window_content_geometry(self, window_info: WindowInfo) -> QRect:
@@ -1389,9 +2077,16 @@ class ScreenshotOverlay(QWidget):
                 content_height = max(1, content_height)
 
                 logger.debug(
-                    f"Window content geometry calculated: borders L={left_border} R={right_border} "
-                    f"T={top_border} B={bottom_border}, content {content_width}x{content_height} "
-                    f"at ({content_x}, {content_y})"
+                    "Window content geometry calculated: borders L=%d R=%d T=%d B=%d, "
+                    "content %dx%d at (%d, %d)",
+                    left_border,
+                    right_border,
+                    top_border,
+                    bottom_border,
+                    content_width,
+                    content_height,
+                    content_x,
+                    content_y,
                 )
 
                 return QRect(content_x, content_y, content_width, content_height)
@@ -1402,6 +2097,21 @@ class ScreenshotOverlay(QWidget):
         # Fallback: use full window bounds if border detection fails
         return QRect(window_info.x, window_info.y, window_info.width, window_info.height)
 
+    def resizeEvent(self, event):
+        """Keep the cached overlay rect and the frozen screen pixmaps sized to the overlay."""
+        super().resizeEvent(event)
+        self._overlay_rect = self.rect()
+        self._highlight_layout = None  # Visible rects are clipped to the overlay
+        if self._captured_screen_pixmaps and self.frozen_screen.size() != self.size():
+            self._fit_screen_pixmaps()
+            if self.magnifier:
+                self.magnifier.set_source_image(self.frozen_screen)
+
+    def moveEvent(self, event):
+        """Keep the cached global origin in sync with the overlay position."""
+        super().moveEvent(event)
+        self._global_origin = self.mapToGlobal(QPoint(0, 0))
+
     def showEvent(self, event):
         """Handle window show event."""
         logger.info("[OVERLAY] showEvent triggered - overlay is being displayed")
@@ -1409,6 +2119,9 @@ class ScreenshotOverlay(QWidget):
 
         super().showEvent(event)
 
+        # Mouse events map local to global coordinates with this cached origin
+        self._global_origin = self.mapToGlobal(QPoint(0, 0))
+
         # Ensure window has focus to receive key events
         self.setFocus()
         self.activateWindow()
@@ -1418,7 +2131,9 @@ class ScreenshotOverlay(QWidget):
         if self.video_mode:
             logger.info("[OVERLAY] Video mode: Skipping screen capture, showing transparent selection overlay")
             # Initialize capture system for geometry queries only
-            self.capture_system = ScreenCapture()
+            from captix.utils.capture import get_shared_screen_capture
+
+            self.capture_system = get_shared_screen_capture()
             # Initialize window detector for window selection
             if not self.window_detector:
                 self.window_detector = WindowDetector()
@@ -1434,13 +2149,18 @@ class ScreenshotOverlay(QWidget):
 
                 # Trigger repaint to show frozen screen right away
                 self.update()
-                logger.info("[OVERLAY] Starting window captures in background")
+                logger.info("[OVERLAY] Starting window collection in background")
 
-            # Capture windows in background thread (after full screenshot is done)
-            if not self._captures_complete:
-                capture_thread = threading.Thread(target=self._do_window_captures, daemon=True)
-                capture_thread.start()
-                logger.info("[OVERLAY] Started background window capture thread")
+            # Collect windows on the capture worker (after full screenshot is done)
+            if not self._captures_complete and not self._window_collection_future:
+                if not self._capture_executor:
+                    self._capture_executor = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix="captix-capture"
+                    )
+                self._window_collection_future = self._capture_executor.submit(
+                    self._do_window_captures
+                )
+                logger.info("[OVERLAY] Started background window capture worker")
 
         # Start the fade-in animation now that the window is visible
         if self.fade_animation and self.fade_animation.state() != QPropertyAnimation.State.Running:
@@ -1451,11 +2171,11 @@ class ScreenshotOverlay(QWidget):
         logger.info(f"[OVERLAY] showEvent completed in {show_time*1000:.1f}ms - overlay ready for interaction")
 
     def _do_window_captures(self):
-        """Perform window captures in background thread (full screenshot already done).
+        """Collect capturable windows on the capture worker (full screenshot already done).
 
-        Thread Safety: This method runs in a background thread during initialization.
-        The lock protects all writes to captured_windows and _captures_complete.
-        After the lock is released and the signal is emitted, captured_windows
+        Thread Safety: This method runs on the capture worker during initialization.
+        The lock protects all writes to _capturable_windows and _captures_complete.
+        After the lock is released and the signal is emitted, _capturable_windows
         becomes effectively read-only, so main thread can read without locks.
         """
         try:
@@ -1464,16 +2184,16 @@ class ScreenshotOverlay(QWidget):
 
             with self._capture_lock:
                 # Full screenshot was already captured in showEvent
-                # Now capture individual windows
+                # Window content is captured later, on demand
                 capture_start = time.perf_counter()
-                self.capture_all_windows()
+                self.collect_capturable_windows()
                 capture_time = time.perf_counter() - capture_start
-                logger.info(f"[THREAD] Window captures completed in {capture_time*1000:.1f}ms")
+                logger.info(f"[THREAD] Window collection completed in {capture_time*1000:.1f}ms")
 
                 self._captures_complete = True
 
             # Signal completion (thread-safe)
-            # After this signal, main thread can safely read captured_windows without locks
+            # After this signal, main thread can safely read _capturable_windows without locks
             self.captures_complete.emit()
 
             total_time = time.perf_counter() - thread_start
@@ -1484,7 +2204,13 @@ class ScreenshotOverlay(QWidget):
     def _on_captures_complete(self):
         """Handle capture completion in main thread."""
         logger.info("Background captures complete, updating display")
-        self.update()  # Force repaint with captured content
+        self._highlight_hit_rect = self._get_unobstructed_rect(self.highlighted_window)
+
+        # A window hovered before collection finished still needs its capture
+        if self.highlighted_window and not self.highlighted_window.is_root:
+            self._request_window_capture(self.highlighted_window)
+
+        self._request_repaint(refresh_target=True)  # Refresh the highlight with the collected window data
         
     def closeEvent(self, event):
         """Handle window close event."""
@@ -1495,6 +2221,15 @@ class ScreenshotOverlay(QWidget):
             self.heartbeat_timer.stop()
             self.heartbeat_timer = None
 
+        # Stop pending repaints
+        if self._repaint_timer:
+            self._repaint_timer.stop()
+            self._repaint_timer = None
+        if self._move_timer:
+            self._move_timer.stop()
+            self._move_timer = None
+        self._pending_move_pos = None
+
         # Stop external watchdog
         if self.external_watchdog:
             self.external_watchdog.stop_watchdog()
@@ -1505,23 +2240,30 @@ class ScreenshotOverlay(QWidget):
             self.fade_animation.stop()
             self.fade_animation = None
 
-        # Clean up capture system
-        if self.capture_system:
-            self.capture_system.cleanup()
-            self.capture_system = None
+        # Stop the capture worker before the overlay's capture state goes away
+        if self._capture_executor:
+            self._capture_executor.shutdown(wait=True, cancel_futures=True)
+            self._capture_executor = None
+
+        # Release the capture system (shared for the process - closed at exit)
+        self.capture_system = None
 
         # Clean up window detector
         if self.window_detector:
             self.window_detector.cleanup()
             self.window_detector = None
 
-        # Clean up frozen screen pixmap
+        # Clean up frozen screen pixmaps
         self.frozen_screen = None
+        self._dimmed_screen = None
+        self._captured_screen_pixmaps = None
 
         # Clean up enhanced capture data
         self.frozen_full_image = None
+        self._frozen_bgra_view = None
         with self._capture_lock:
             self.captured_windows.clear()
+            self._window_hit_table = None
 
         # Clean up magnifier widget
         if self.magnifier:
@@ -1579,7 +2321,11 @@ class ScreenshotUI:
             self.overlay.showFullScreen()  # Use true fullscreen instead of show()
 
             # Run the application
-            return self.app.exec()
+            exit_code = self.app.exec()
+
+            # Let any screenshot still being saved in the background finish
+            QThreadPool.globalInstance().waitForDone()
+            return exit_code
             
         except Exception as e:
             logger.error(f"Error running screenshot UI: {e}")
@@ -10,9 +10,15 @@ This module handles all screen capture operations including:
 - Clipboard integration
 """
 
+import io
 import os
+import sys
+import array
+import atexit
+import threading
 import ctypes
 import ctypes.util
+import functools
 from typing import Tuple, Optional, List
 from datetime import datetime
 from pathlib import Path
@@ -34,6 +40,17 @@ from .paths import CaptiXPaths
 # Set up logging
 logger = logging.getLogger(__name__)
 
+
+@functools.lru_cache(maxsize=None)
+def _find_library(name: str) -> Optional[str]:
+    """Locate a shared library once per process (find_library runs ldconfig)."""
+    return ctypes.util.find_library(name)
+
+
+# zlib level for saved PNGs - screenshots are interactive, so encode speed
+# matters more than file size (level 1 is several times faster than the default 6)
+PNG_COMPRESS_LEVEL = 1
+
 # XFixes cursor capture using ctypes (based on PyXCursor)
 PIXEL_DATA_PTR = ctypes.POINTER(ctypes.c_ulong)
 Atom = ctypes.c_ulong
@@ -55,13 +72,13 @@ class XComposite:
                 raise Exception("$DISPLAY not set.")
 
         # Load XComposite library
-        xcomposite_lib = ctypes.util.find_library("Xcomposite")
+        xcomposite_lib = _find_library("Xcomposite")
         if not xcomposite_lib:
             raise Exception("No XComposite library found.")
         self.xcomposite = ctypes.cdll.LoadLibrary(xcomposite_lib)
 
         # Load X11 library
-        x11 = ctypes.util.find_library("X11")
+        x11 = _find_library("X11")
         if not x11:
             raise Exception("No X11 library found.")
         self.xlib = ctypes.cdll.LoadLibrary(x11)
@@ -253,6 +270,385 @@ class Display(ctypes.Structure):
     pass
 
 
+class XImage(ctypes.Structure):
+    _fields_ = [
+        ("width", ctypes.c_int),
+        ("height", ctypes.c_int),
+        ("xoffset", ctypes.c_int),
+        ("format", ctypes.c_int),
+        ("data", ctypes.c_void_p),
+        ("byte_order", ctypes.c_int),
+        ("bitmap_unit", ctypes.c_int),
+        ("bitmap_bit_order", ctypes.c_int),
+        ("bitmap_pad", ctypes.c_int),
+        ("depth", ctypes.c_int),
+        ("bytes_per_line", ctypes.c_int),
+        ("bits_per_pixel", ctypes.c_int),
+        ("red_mask", ctypes.c_ulong),
+        ("green_mask", ctypes.c_ulong),
+        ("blue_mask", ctypes.c_ulong),
+        ("obdata", ctypes.c_void_p),
+        ("f", ctypes.c_void_p * 6),  # Image manipulation function table
+    ]
+
+
+class XShmSegmentInfo(ctypes.Structure):
+    _fields_ = [
+        ("shmseg", ctypes.c_ulong),
+        ("shmid", ctypes.c_int),
+        ("shmaddr", ctypes.c_void_p),
+        ("readOnly", ctypes.c_int),
+    ]
+
+
+# int (*XErrorHandler)(Display *, XErrorEvent *)
+XErrorHandler = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p)
+
+# System V shared memory constants
+IPC_PRIVATE = 0
+IPC_CREAT = 0o1000
+IPC_RMID = 0
+
+
+class XShm:
+    """MIT-SHM extension interface for screen capture through shared memory.
+
+    The X server writes the pixels straight into a shared memory segment
+    instead of serializing them into a protocol reply that python-xlib has
+    to read and parse. Only works for clients on the same host as the server.
+    """
+
+    def __init__(self, display_name=None):
+        """Initialize MIT-SHM interface."""
+        if not display_name:
+            try:
+                display_name = os.environ["DISPLAY"].encode("utf-8")
+            except KeyError:
+                raise Exception("$DISPLAY not set.")
+
+        # Load Xext library (MIT-SHM client side)
+        xext = _find_library("Xext")
+        if not xext:
+            raise Exception("No Xext library found.")
+        self.xext = ctypes.cdll.LoadLibrary(xext)
+
+        # Load X11 library
+        x11 = _find_library("X11")
+        if not x11:
+            raise Exception("No X11 library found.")
+        self.xlib = ctypes.cdll.LoadLibrary(x11)
+
+        # Load C library for System V shared memory
+        libc = _find_library("c")
+        if not libc:
+            raise Exception("No C library found.")
+        self.libc = ctypes.CDLL(libc, use_errno=True)
+
+        # Set up MIT-SHM functions
+        self.xext.XShmQueryExtension.restype = ctypes.c_bool
+        self.xext.XShmQueryExtension.argtypes = [ctypes.c_void_p]
+
+        self.xext.XShmCreateImage.restype = ctypes.POINTER(XImage)
+        self.xext.XShmCreateImage.argtypes = [
+            ctypes.c_void_p,
+            ctypes.c_void_p,
+            ctypes.c_uint,
+            ctypes.c_int,
+            ctypes.c_void_p,
+            ctypes.POINTER(XShmSegmentInfo),
+            ctypes.c_uint,
+            ctypes.c_uint,
+        ]
+
+        self.xext.XShmAttach.restype = ctypes.c_bool
+        self.xext.XShmAttach.argtypes = [ctypes.c_void_p, ctypes.POINTER(XShmSegmentInfo)]
+
+        self.xext.XShmDetach.restype = ctypes.c_bool
+        self.xext.XShmDetach.argtypes = [ctypes.c_void_p, ctypes.POINTER(XShmSegmentInfo)]
+
+        self.xext.XShmGetImage.restype = ctypes.c_bool
+        self.xext.XShmGetImage.argtypes = [
+            ctypes.c_void_p,
+            ctypes.c_ulong,
+            ctypes.POINTER(XImage),
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.c_ulong,
+        ]
+
+        # Set up X11 functions
+        self.xlib.XOpenDisplay.restype = ctypes.c_void_p
+        self.xlib.XOpenDisplay.argtypes = [ctypes.c_char_p]
+
+        self.xlib.XCloseDisplay.restype = None
+        self.xlib.XCloseDisplay.argtypes = [ctypes.c_void_p]
+
+        self.xlib.XDefaultScreen.restype = ctypes.c_int
+        self.xlib.XDefaultScreen.argtypes = [ctypes.c_void_p]
+
+        self.xlib.XRootWindow.restype = ctypes.c_ulong
+        self.xlib.XRootWindow.argtypes = [ctypes.c_void_p, ctypes.c_int]
+
+        self.xlib.XDefaultVisual.restype = ctypes.c_void_p
+        self.xlib.XDefaultVisual.argtypes = [ctypes.c_void_p, ctypes.c_int]
+
+        self.xlib.XDefaultDepth.restype = ctypes.c_int
+        self.xlib.XDefaultDepth.argtypes = [ctypes.c_void_p, ctypes.c_int]
+
+        self.xlib.XSync.restype = ctypes.c_int
+        self.xlib.XSync.argtypes = [ctypes.c_void_p, ctypes.c_bool]
+
+        self.xlib.XFree.restype = ctypes.c_int
+        self.xlib.XFree.argtypes = [ctypes.c_void_p]
+
+        self.xlib.XGetGeometry.restype = ctypes.c_int
+        self.xlib.XGetGeometry.argtypes = [
+            ctypes.c_void_p,
+            ctypes.c_ulong,
+            ctypes.POINTER(ctypes.c_ulong),
+            ctypes.POINTER(ctypes.c_int),
+            ctypes.POINTER(ctypes.c_int),
+            ctypes.POINTER(ctypes.c_uint),
+            ctypes.POINTER(ctypes.c_uint),
+            ctypes.POINTER(ctypes.c_uint),
+            ctypes.POINTER(ctypes.c_uint),
+        ]
+
+        self.xlib.XSetErrorHandler.restype = ctypes.c_void_p
+        self.xlib.XSetErrorHandler.argtypes = [ctypes.c_void_p]
+
+        # Set up System V shared memory functions
+        self.libc.shmget.restype = ctypes.c_int
+        self.libc.shmget.argtypes = [ctypes.c_int, ctypes.c_size_t, ctypes.c_int]
+
+        self.libc.shmat.restype = ctypes.c_void_p
+        self.libc.shmat.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_int]
+
+        self.libc.shmdt.restype = ctypes.c_int
+        self.libc.shmdt.argtypes = [ctypes.c_void_p]
+
+        self.libc.shmctl.restype = ctypes.c_int
+        self.libc.shmctl.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_void_p]
+
+        # Open display
+        self.display = self.xlib.XOpenDisplay(display_name)
+        if not self.display:
+            raise Exception(f"Could not open display {display_name}")
+
+        # Check if MIT-SHM extension is available
+        if not self.xext.XShmQueryExtension(self.display):
+            self.xlib.XCloseDisplay(self.display)
+            self.display = None
+            raise Exception("MIT-SHM extension not available")
+
+        screen_number = self.xlib.XDefaultScreen(self.display)
+        self.root = self.xlib.XRootWindow(self.display, screen_number)
+        self.visual = self.xlib.XDefaultVisual(self.display, screen_number)
+        self.depth = self.xlib.XDefaultDepth(self.display, screen_number)
+
+        # Xlib's default error handler exits the process - attaching the segment
+        # (refused for a remote client) runs under this one instead
+        self._x_error = False
+        self._error_handler = XErrorHandler(self._on_x_error)
+
+        # Cleared after the server refuses to attach a segment
+        self.usable = True
+
+        # One segment, attached for the lifetime of the interface and grown on
+        # demand - captures after the first (full screen) one allocate nothing.
+        # Images keep a pointer to this structure, so it is updated in place
+        self._shminfo = XShmSegmentInfo()
+        self._shminfo.shmid = -1
+        self._segment_size = 0
+        self._segment_lock = threading.Lock()  # Captures may come from several threads
+
+    def _on_x_error(self, display_ptr, error_event) -> int:
+        """Record an X error raised while the trapping handler is installed."""
+        self._x_error = True
+        return 0
+
+    def _attach_segment(self) -> bool:
+        """Attach the segment on the server, returning False if it refused.
+
+        The refusal arrives as an X error, so XShmAttach and the XSync that
+        surfaces it run under the trapping handler. XSetErrorHandler is process
+        global, which is why only this one-time setup request is trapped -
+        not the per-capture XShmGetImage.
+        """
+        self._x_error = False
+        previous_handler = self.xlib.XSetErrorHandler(
+            ctypes.cast(self._error_handler, ctypes.c_void_p)
+        )
+        try:
+            attached = self.xext.XShmAttach(self.display, ctypes.byref(self._shminfo))
+            self.xlib.XSync(self.display, False)
+        finally:
+            self.xlib.XSetErrorHandler(previous_handler)
+        return bool(attached) and not self._x_error
+
+    def _area_on_root(self, x: int, y: int, width: int, height: int) -> bool:
+        """Check that the area lies inside the root window.
+
+        XShmGetImage raises BadMatch for anything else, which the default error
+        handler would turn into a process exit.
+        """
+        root = ctypes.c_ulong()
+        root_x, root_y = ctypes.c_int(), ctypes.c_int()
+        root_width, root_height = ctypes.c_uint(), ctypes.c_uint()
+        border, depth = ctypes.c_uint(), ctypes.c_uint()
+        if not self.xlib.XGetGeometry(
+            self.display,
+            self.root,
+            ctypes.byref(root),
+            ctypes.byref(root_x),
+            ctypes.byref(root_y),
+            ctypes.byref(root_width),
+            ctypes.byref(root_height),
+            ctypes.byref(border),
+            ctypes.byref(depth),
+        ):
+            return False
+        return (
+            x >= 0
+            and y >= 0
+            and width > 0
+            and height > 0
+            and x + width <= root_width.value
+            and y + height <= root_height.value
+        )
+
+    def _ensure_segment(self, size: int) -> bool:
+        """Make sure an attached shared memory segment of at least size bytes exists."""
+        if self._segment_size >= size:
+            return True
+        self._release_segment()
+
+        shminfo = self._shminfo
+        shminfo.shmid = self.libc.shmget(IPC_PRIVATE, size, IPC_CREAT | 0o600)
+        if shminfo.shmid < 0:
+            logger.debug(f"shmget failed: errno {ctypes.get_errno()}")
+            return False
+
+        shmaddr = self.libc.shmat(shminfo.shmid, None, 0)
+        if shmaddr is None or shmaddr == ctypes.c_void_p(-1).value:
+            logger.debug(f"shmat failed: errno {ctypes.get_errno()}")
+            self.libc.shmctl(shminfo.shmid, IPC_RMID, None)
+            shminfo.shmid = -1
+            return False
+        shminfo.shmaddr = shmaddr
+        shminfo.readOnly = 0
+
+        attached = self._attach_segment()
+
+        # Removed once both sides detach - nothing leaks if the process dies
+        self.libc.shmctl(shminfo.shmid, IPC_RMID, None)
+
+        if not attached:
+            # Typically a client on another host - don't retry every capture
+            logger.info("X server refused the MIT-SHM segment, using regular capture")
+            self.usable = False
+            self.libc.shmdt(shmaddr)
+            shminfo.shmaddr = None
+            shminfo.shmid = -1
+            return False
+
+        self._segment_size = size
+        return True
+
+    def _release_segment(self):
+        """Detach the shared memory segment from the server and this process."""
+        if not self._segment_size:
+            return
+        self.xext.XShmDetach(self.display, ctypes.byref(self._shminfo))
+        self.xlib.XSync(self.display, False)
+        self.libc.shmdt(self._shminfo.shmaddr)
+        self._shminfo.shmaddr = None
+        self._shminfo.shmid = -1
+        self._segment_size = 0
+
+    def capture_area(self, x: int, y: int, width: int, height: int) -> Optional[Image.Image]:
+        """Capture an area of the root window through the shared memory segment.
+
+        Args:
+            x: X coordinate of the top-left corner
+            y: Y coordinate of the top-left corner
+            width: Width of the area to capture
+            height: Height of the area to capture
+
+        Returns:
+            PIL Image (RGB, or RGBA for 32-bit depth), or None if the area
+            can't be captured this way
+        """
+        with self._segment_lock:
+            if not self.usable or not self.display:
+                return None
+            return self._capture_area_locked(x, y, width, height)
+
+    def _capture_area_locked(self, x: int, y: int, width: int, height: int) -> Optional[Image.Image]:
+        """Capture an area into the shared segment (caller holds the segment lock)."""
+        if not self._area_on_root(x, y, width, height):
+            # Left to the regular GetImage path, which reports errors as exceptions
+            return None
+
+        ximage = self.xext.XShmCreateImage(
+            self.display,
+            self.visual,
+            self.depth,
+            2,  # ZPixmap
+            None,
+            ctypes.byref(self._shminfo),
+            width,
+            height,
+        )
+        if not ximage:
+            return None
+
+        try:
+            image = ximage.contents
+            # Pixels are read as little-endian 32-bit words (LSBFirst = 0)
+            if image.bits_per_pixel != 32 or image.byte_order != 0 or image.depth not in (24, 32):
+                logger.debug(
+                    "MIT-SHM image layout not supported: depth %d, %d bpp, byte order %d",
+                    image.depth,
+                    image.bits_per_pixel,
+                    image.byte_order,
+                )
+                self.usable = False
+                return None
+
+            data_size = image.bytes_per_line * height
+            if not self._ensure_segment(data_size):
+                return None
+            image.data = self._shminfo.shmaddr
+
+            # AllPlanes = 0xFFFFFFFF
+            if not self.xext.XShmGetImage(self.display, self.root, ximage, x, y, 0xFFFFFFFF):
+                logger.debug("XShmGetImage failed for area %dx%d at (%d, %d)", width, height, x, y)
+                return None
+
+            # Decode straight from the segment - the PIL image is the only copy
+            # (it must be made before the next capture overwrites the segment)
+            segment = (ctypes.c_char * data_size).from_address(self._shminfo.shmaddr)
+            if image.depth == 24:
+                mode, raw_mode = "RGB", "BGRX"  # 24-bit color
+            else:
+                mode, raw_mode = "RGBA", "BGRA"  # 32-bit color with alpha
+            return Image.frombytes(
+                mode, (width, height), segment, "raw", raw_mode, image.bytes_per_line
+            )
+
+        finally:
+            # The segment isn't owned by the image, so only the structure is freed
+            self.xlib.XFree(ximage)
+
+    def close(self):
+        if hasattr(self, "display") and self.display:
+            with self._segment_lock:
+                self._release_segment()
+                self.xlib.XCloseDisplay(self.display)
+                self.display = None
+
+
 class XFixesCursor:
     """Direct XFixes cursor access using ctypes."""
 
@@ -265,13 +661,13 @@ class XFixesCursor:
                 raise Exception("$DISPLAY not set.")
 
         # Load XFixes library
-        XFixes = ctypes.util.find_library("Xfixes")
+        XFixes = _find_library("Xfixes")
         if not XFixes:
             raise Exception("No XFixes library found.")
         self.XFixeslib = ctypes.cdll.LoadLibrary(XFixes)
 
         # Load X11 library
-        x11 = ctypes.util.find_library("X11")
+        x11 = _find_library("X11")
         if not x11:
             raise Exception("No X11 library found.")
         self.xlib = ctypes.cdll.LoadLibrary(x11)
@@ -332,6 +728,15 @@ class ScreenCapture:
             logger.warning(f"Failed to initialize XComposite: {e}")
             self.xcomposite = None
 
+        # Initialize MIT-SHM interface for fast screen area capture
+        try:
+            self.xshm = XShm()
+        except Exception as e:
+            # MIT-SHM may be missing (e.g. some remote or nested servers).
+            # Screen capture falls back to regular GetImage requests.
+            logger.warning(f"Failed to initialize MIT-SHM: {e}")
+            self.xshm = None
+
         # Initialize window detector for window-based capture
         try:
             self.window_detector = WindowDetector()
@@ -339,25 +744,67 @@ class ScreenCapture:
             logger.warning(f"Failed to initialize window detector: {e}")
             self.window_detector = None
 
+        # Monitor layout rarely changes - cached until RandR reports a change
+        self._screen_geometry: Optional[Tuple[int, int, int, int]] = None
+        try:
+            randr.select_input(
+                self.root,
+                randr.RRScreenChangeNotifyMask
+                | randr.RRCrtcChangeNotifyMask
+                | randr.RROutputChangeNotifyMask,
+            )
+        except Exception as e:
+            # Without notifications the layout can't be cached safely
+            logger.warning(f"Failed to select RandR notifications: {e}")
+            self._screen_layout_events = False
+        else:
+            self._screen_layout_events = True
+
+    def _screen_layout_changed(self) -> bool:
+        """Drain queued RandR notifications, returning True if there were any."""
+        changed = False
+        # Only RandR notifications are selected on this connection
+        while self.display.pending_events():
+            self.display.next_event()
+            changed = True
+        return changed
+
     def get_screen_geometry(self) -> Tuple[int, int, int, int]:
         """
         Get the full screen geometry including all monitors.
-        
+
+        The result is cached and only queried again after RandR reports a
+        screen, CRTC or output change.
+
         Returns:
             Tuple of (x, y, width, height) covering all screens
         """
+        if not self._screen_layout_events:
+            return self._query_screen_geometry()
+
+        if self._screen_layout_changed() or self._screen_geometry is None:
+            self._screen_geometry = self._query_screen_geometry()
+        return self._screen_geometry
+
+    def _query_screen_geometry(self) -> Tuple[int, int, int, int]:
+        """Query the full screen geometry from the X server (RandR, or the root window)."""
         try:
-            # Try to use RandR extension for multi-monitor support
-            screen_resources = randr.get_screen_resources(self.root)
+            # Try to use RandR extension for multi-monitor support.
+            # The "current" resources skip the output hardware probe of a full query
+            try:
+                screen_resources = randr.get_screen_resources_current(self.root)
+            except Exception:
+                # RandR older than 1.3
+                screen_resources = randr.get_screen_resources(self.root)
             
             min_x = min_y = 0
             max_x = max_y = 0
             
-            for output in screen_resources.outputs:
-                output_info = randr.get_output_info(self.root, output, screen_resources.config_timestamp)
-                if output_info.connection == randr.Connected and output_info.crtc:
-                    crtc_info = randr.get_crtc_info(self.root, output_info.crtc, screen_resources.config_timestamp)
-                    
+            # Active CRTCs (with a mode and at least one output) are the monitors -
+            # one request per CRTC instead of one per output plus one per CRTC
+            for crtc in screen_resources.crtcs:
+                crtc_info = randr.get_crtc_info(self.root, crtc, screen_resources.config_timestamp)
+                if crtc_info.mode and crtc_info.outputs:
                     min_x = min(min_x, crtc_info.x)
                     min_y = min(min_y, crtc_info.y)
                     max_x = max(max_x, crtc_info.x + crtc_info.width)
@@ -388,19 +835,23 @@ class ScreenCapture:
             PIL Image object or None if capture failed
         """
         try:
-            # Get the raw image data from X11
-            raw_image = self.root.get_image(x, y, width, height, X.ZPixmap, 0xffffffff)
-            
-            # Convert to PIL Image
-            if raw_image.depth == 24:
-                # 24-bit color
-                pil_image = Image.frombytes("RGB", (width, height), raw_image.data, "raw", "BGRX")
-            elif raw_image.depth == 32:
-                # 32-bit color with alpha
-                pil_image = Image.frombytes("RGBA", (width, height), raw_image.data, "raw", "BGRA")
-            else:
-                logger.error(f"Unsupported color depth: {raw_image.depth}")
-                return None
+            # Capture through shared memory when possible
+            pil_image = self.xshm.capture_area(x, y, width, height) if self.xshm else None
+
+            if pil_image is None:
+                # Get the raw image data from X11
+                raw_image = self.root.get_image(x, y, width, height, X.ZPixmap, 0xffffffff)
+
+                # Convert to PIL Image
+                if raw_image.depth == 24:
+                    # 24-bit color
+                    pil_image = Image.frombytes("RGB", (width, height), raw_image.data, "raw", "BGRX")
+                elif raw_image.depth == 32:
+                    # 32-bit color with alpha
+                    pil_image = Image.frombytes("RGBA", (width, height), raw_image.data, "raw", "BGRA")
+                else:
+                    logger.error(f"Unsupported color depth: {raw_image.depth}")
+                    return None
             
             # Include cursor if requested
             if include_cursor:
@@ -439,21 +890,22 @@ class ScreenCapture:
 
                 # Check if cursor is within the captured area
                 if 0 <= cursor_x < image.width and 0 <= cursor_y < image.height:
-                    # Convert cursor data to PIL Image
-                    cursor_pil = self._convert_cursor_to_pil(cursor_image)
-
-                    if cursor_pil:
-                        # Calculate hotspot position
-                        hotspot_x = cursor_x - cursor_image.xhot
-                        hotspot_y = cursor_y - cursor_image.yhot
-
-                        # Ensure we don't paste outside image bounds
-                        if (
-                            hotspot_x + cursor_image.width > 0
-                            and hotspot_y + cursor_image.height > 0
-                            and hotspot_x < image.width
-                            and hotspot_y < image.height
-                        ):
+                    # Calculate hotspot position
+                    hotspot_x = cursor_x - cursor_image.xhot
+                    hotspot_y = cursor_y - cursor_image.yhot
+
+                    # Ensure we don't paste outside image bounds
+                    # (checked before decoding the cursor pixels)
+                    if (
+                        hotspot_x + cursor_image.width > 0
+                        and hotspot_y + cursor_image.height > 0
+                        and hotspot_x < image.width
+                        and hotspot_y < image.height
+                    ):
+                        # Convert cursor data to PIL Image
+                        cursor_pil = self._convert_cursor_to_pil(cursor_image)
+
+                        if cursor_pil:
                             # Paste cursor onto the main image
                             if cursor_pil.mode == "RGBA":
                                 image.paste(
@@ -462,9 +914,7 @@ class ScreenCapture:
                             else:
                                 image.paste(cursor_pil, (hotspot_x, hotspot_y))
 
-                            logger.debug(
-                                f"Added native cursor at ({hotspot_x}, {hotspot_y})"
-                            )
+                            logger.debug("Added native cursor at (%d, %d)", hotspot_x, hotspot_y)
 
         except Exception as e:
             logger.error(f"Failed to add native cursor: {e}")
@@ -490,25 +940,25 @@ class ScreenCapture:
             if not pixels_ptr:
                 return None
 
-            # Convert to RGBA format for PIL
-            rgba_data = bytearray(width * height * 4)
-
-            for i in range(width * height):
-                # Extract ARGB components from 32-bit value
-                argb = pixels_ptr[i]
-                a = (argb >> 24) & 0xFF
-                r = (argb >> 16) & 0xFF
-                g = (argb >> 8) & 0xFF
-                b = argb & 0xFF
-
-                # Store as RGBA
-                base_idx = i * 4
-                rgba_data[base_idx] = r
-                rgba_data[base_idx + 1] = g
-                rgba_data[base_idx + 2] = b
-                rgba_data[base_idx + 3] = a
-
-            return Image.frombytes("RGBA", (width, height), bytes(rgba_data))
+            # Each pixel is an unsigned long holding 32-bit ARGB in its low bits.
+            # Copy the array once and let PIL's raw decoder reorder the channels
+            pixel_size = ctypes.sizeof(ctypes.c_ulong)
+            pixel_data = memoryview(ctypes.string_at(pixels_ptr, width * height * pixel_size))
+            if pixel_size == 8:
+                # Keep only the 32-bit ARGB word of each 64-bit value
+                argb_word = 0 if sys.byteorder == "little" else 1
+                pixel_data = pixel_data.cast("I")[argb_word::2]
+
+            pixel_bytes = pixel_data.tobytes()
+            if sys.byteorder == "big":
+                # Reorder to the little-endian layout of ARGB words (B, G, R, A bytes)
+                argb_words = array.array("I", pixel_bytes)
+                argb_words.byteswap()
+                pixel_bytes = argb_words.tobytes()
+
+            # XFixes cursors have premultiplied alpha, while pasting with the cursor
+            # as its own mask expects straight alpha - "BGRa" unpremultiplies
+            return Image.frombytes("RGBA", (width, height), pixel_bytes, "raw", "BGRa")
 
         except Exception as e:
             logger.error(f"Failed to convert cursor image: {e}")
@@ -861,21 +1311,21 @@ class ScreenCapture:
                     0 <= cursor_window_x < window_info.width
                     and 0 <= cursor_window_y < window_info.height
                 ):
-                    # Convert cursor data to PIL Image
-                    cursor_pil = self._convert_cursor_to_pil(cursor_image)
-
-                    if cursor_pil:
-                        # Calculate hotspot position relative to window
-                        hotspot_x = cursor_window_x - cursor_image.xhot
-                        hotspot_y = cursor_window_y - cursor_image.yhot
-
-                        # Ensure we don't paste outside window bounds
-                        if (
-                            hotspot_x + cursor_image.width > 0
-                            and hotspot_y + cursor_image.height > 0
-                            and hotspot_x < window_info.width
-                            and hotspot_y < window_info.height
-                        ):
+                    # Calculate hotspot position relative to window
+                    hotspot_x = cursor_window_x - cursor_image.xhot
+                    hotspot_y = cursor_window_y - cursor_image.yhot
+
+                    # Ensure we don't paste outside window bounds
+                    if (
+                        hotspot_x + cursor_image.width > 0
+                        and hotspot_y + cursor_image.height > 0
+                        and hotspot_x < window_info.width
+                        and hotspot_y < window_info.height
+                    ):
+                        # Convert cursor data to PIL Image
+                        cursor_pil = self._convert_cursor_to_pil(cursor_image)
+
+                        if cursor_pil:
                             # Paste cursor onto the window image
                             if cursor_pil.mode == "RGBA":
                                 image.paste(
@@ -885,7 +1335,7 @@ class ScreenCapture:
                                 image.paste(cursor_pil, (hotspot_x, hotspot_y))
 
                             logger.debug(
-                                f"Added cursor to pure window at ({hotspot_x}, {hotspot_y})"
+                                "Added cursor to pure window at (%d, %d)", hotspot_x, hotspot_y
                             )
 
         except Exception as e:
@@ -940,21 +1390,21 @@ class ScreenCapture:
                     0 <= cursor_content_x < content_width
                     and 0 <= cursor_content_y < content_height
                 ):
-                    # Convert cursor data to PIL Image
-                    cursor_pil = self._convert_cursor_to_pil(cursor_image)
-
-                    if cursor_pil:
-                        # Calculate hotspot position relative to content area
-                        hotspot_x = cursor_content_x - cursor_image.xhot
-                        hotspot_y = cursor_content_y - cursor_image.yhot
-
-                        # Ensure we don't paste outside content bounds
-                        if (
-                            hotspot_x + cursor_image.width > 0
-                            and hotspot_y + cursor_image.height > 0
-                            and hotspot_x < content_width
-                            and hotspot_y < content_height
-                        ):
+                    # Calculate hotspot position relative to content area
+                    hotspot_x = cursor_content_x - cursor_image.xhot
+                    hotspot_y = cursor_content_y - cursor_image.yhot
+
+                    # Ensure we don't paste outside content bounds
+                    if (
+                        hotspot_x + cursor_image.width > 0
+                        and hotspot_y + cursor_image.height > 0
+                        and hotspot_x < content_width
+                        and hotspot_y < content_height
+                    ):
+                        # Convert cursor data to PIL Image
+                        cursor_pil = self._convert_cursor_to_pil(cursor_image)
+
+                        if cursor_pil:
                             # Paste cursor onto the content image
                             if cursor_pil.mode == "RGBA":
                                 image.paste(
@@ -964,8 +1414,12 @@ class ScreenCapture:
                                 image.paste(cursor_pil, (hotspot_x, hotspot_y))
 
                             logger.debug(
-                                f"Added cursor to content area at ({hotspot_x}, {hotspot_y}) "
-                                f"(adjusted for borders: L={left_border}, T={top_border})"
+                                "Added cursor to content area at (%d, %d) "
+                                "(adjusted for borders: L=%d, T=%d)",
+                                hotspot_x,
+                                hotspot_y,
+                                left_border,
+                                top_border,
                             )
 
         except Exception as e:
@@ -1113,13 +1567,15 @@ class ScreenCapture:
         filepath = os.path.join(directory, filename)
 
         try:
-            # Save to final destination
-            image.save(filepath, "PNG")
-
-            # Get file size
-            file_size = os.path.getsize(filepath)
+            # Encode in memory, then write the file in a single call -
+            # the size is known without a stat afterwards
+            png_buffer = io.BytesIO()
+            image.save(png_buffer, "PNG", compress_level=PNG_COMPRESS_LEVEL)
+            with png_buffer.getbuffer() as png_data, open(filepath, "wb") as png_file:
+                png_file.write(png_data)
+                file_size = len(png_data)
 
-            logger.info(f"Screenshot saved: {filepath} ({file_size} bytes)")
+            logger.info("Screenshot saved: %s (%d bytes)", filepath, file_size)
 
             return filepath, file_size
 
@@ -1134,6 +1590,8 @@ class ScreenCapture:
                 self.xfixes_cursor.close()
             if self.xcomposite:
                 self.xcomposite.close()
+            if self.xshm:
+                self.xshm.close()
             if self.window_detector:
                 self.window_detector.cleanup()
             self.display.close()
@@ -1141,6 +1599,30 @@ class ScreenCapture:
             logger.warning(f"Error during cleanup: {e}")
 
 
+_shared_capture: Optional[ScreenCapture] = None
+_shared_capture_lock = threading.Lock()
+
+
+def get_shared_screen_capture() -> ScreenCapture:
+    """
+    Get the process-wide ScreenCapture, creating it on first use.
+
+    Opening the X display and the XFixes/XComposite libraries is the slow part
+    of ScreenCapture, so components running in one process (overlay, recorder)
+    share a single instance. It is cleaned up at interpreter exit; callers must
+    not call cleanup() on it themselves.
+
+    Returns:
+        Shared ScreenCapture instance
+    """
+    global _shared_capture
+    with _shared_capture_lock:
+        if _shared_capture is None:
+            _shared_capture = ScreenCapture()
+            atexit.register(_shared_capture.cleanup)
+        return _shared_capture
+
+
 def capture_screenshot(
     x: int = None,
     y: int = None,
@@ -1164,49 +1646,45 @@ def capture_screenshot(
     Returns:
         Tuple of (filepath, file_size_bytes)
     """
-    capture = ScreenCapture()
-
-    try:
-        if x is not None and y is not None and width is not None and height is not None:
-            # Capture specific area
-            image = capture.capture_screen_area(x, y, width, height, include_cursor)
-        else:
-            # Capture full screen
-            image = capture.capture_full_screen(include_cursor)
-
-        if image is None:
-            raise RuntimeError("Failed to capture screen")
-
-        # Save the screenshot with appropriate type
-        if x is not None and y is not None and width is not None and height is not None:
-            capture_type = "area"
-        else:
-            capture_type = "full"
-        filepath, file_size = capture.save_screenshot(
-            image, save_path, capture_type=capture_type
-        )
-
-        # Copy to clipboard if requested
-        if copy_to_clipboard:
-            try:
-                if copy_image_to_clipboard(filepath):
-                    logger.info("Screenshot copied to clipboard")
-                else:
-                    logger.warning("Failed to copy screenshot to clipboard")
-            except Exception as e:
-                logger.warning(f"Clipboard copy failed: {e}")
-
-        # Show notification if requested
-        if show_notification:
-            try:
-                notify_screenshot_saved(filepath, file_size)
-            except Exception as e:
-                logger.warning(f"Failed to show notification: {e}")
+    capture = get_shared_screen_capture()
+
+    if x is not None and y is not None and width is not None and height is not None:
+        # Capture specific area
+        image = capture.capture_screen_area(x, y, width, height, include_cursor)
+    else:
+        # Capture full screen
+        image = capture.capture_full_screen(include_cursor)
+
+    if image is None:
+        raise RuntimeError("Failed to capture screen")
+
+    # Save the screenshot with appropriate type
+    if x is not None and y is not None and width is not None and height is not None:
+        capture_type = "area"
+    else:
+        capture_type = "full"
+    filepath, file_size = capture.save_screenshot(
+        image, save_path, capture_type=capture_type
+    )
+
+    # Copy to clipboard if requested
+    if copy_to_clipboard:
+        try:
+            if copy_image_to_clipboard(filepath):
+                logger.info("Screenshot copied to clipboard")
+            else:
+                logger.warning("Failed to copy screenshot to clipboard")
+        except Exception as e:
+            logger.warning(f"Clipboard copy failed: {e}")
 
-        return filepath, file_size
+    # Show notification if requested
+    if show_notification:
+        try:
+            notify_screenshot_saved(filepath, file_size)
+        except Exception as e:
+            logger.warning(f"Failed to show notification: {e}")
 
-    finally:
-        capture.cleanup()
+    return filepath, file_size
 
 
 def capture_window_at_position(
@@ -1231,41 +1709,37 @@ def capture_window_at_position(
     Returns:
         Tuple of (filepath, file_size_bytes)
     """
-    capture = ScreenCapture()
+    capture = get_shared_screen_capture()
 
-    try:
-        # Capture window at position
-        image = capture.capture_window_at_position(x, y, include_cursor)
-
-        if image is None:
-            raise RuntimeError(f"Failed to capture window at position ({x}, {y})")
+    # Capture window at position
+    image = capture.capture_window_at_position(x, y, include_cursor)
 
-        # Save the screenshot
-        filepath, file_size = capture.save_screenshot(
-            image, save_path, capture_type="win"
-        )
+    if image is None:
+        raise RuntimeError(f"Failed to capture window at position ({x}, {y})")
 
-        # Copy to clipboard if requested
-        if copy_to_clipboard:
-            try:
-                if copy_image_to_clipboard(filepath):
-                    logger.info("Screenshot copied to clipboard")
-                else:
-                    logger.warning("Failed to copy screenshot to clipboard")
-            except Exception as e:
-                logger.warning(f"Clipboard copy failed: {e}")
+    # Save the screenshot
+    filepath, file_size = capture.save_screenshot(
+        image, save_path, capture_type="win"
+    )
 
-        # Show notification if requested
-        if show_notification:
-            try:
-                notify_screenshot_saved(filepath, file_size)
-            except Exception as e:
-                logger.warning(f"Failed to show notification: {e}")
+    # Copy to clipboard if requested
+    if copy_to_clipboard:
+        try:
+            if copy_image_to_clipboard(filepath):
+                logger.info("Screenshot copied to clipboard")
+            else:
+                logger.warning("Failed to copy screenshot to clipboard")
+        except Exception as e:
+            logger.warning(f"Clipboard copy failed: {e}")
 
-        return filepath, file_size
+    # Show notification if requested
+    if show_notification:
+        try:
+            notify_screenshot_saved(filepath, file_size)
+        except Exception as e:
+            logger.warning(f"Failed to show notification: {e}")
 
-    finally:
-        capture.cleanup()
+    return filepath, file_size
 
 
 def get_window_info_at_position(x: int, y: int) -> Optional[WindowInfo]:
@@ -1279,12 +1753,7 @@ def get_window_info_at_position(x: int, y: int) -> Optional[WindowInfo]:
     Returns:
         WindowInfo object or None if no window found
     """
-    capture = ScreenCapture()
-
-    try:
-        return capture.get_window_at_position(x, y)
-    finally:
-        capture.cleanup()
+    return get_shared_screen_capture().get_window_at_position(x, y)
 
 
 def list_visible_windows() -> List[WindowInfo]:
@@ -1294,12 +1763,7 @@ def list_visible_windows() -> List[WindowInfo]:
     Returns:
         List of WindowInfo objects
     """
-    capture = ScreenCapture()
-
-    try:
-        return capture.get_visible_windows()
-    finally:
-        capture.cleanup()
+    return get_shared_screen_capture().get_visible_windows()
 
 
 def capture_window_at_position_pure(
@@ -1325,43 +1789,39 @@ def capture_window_at_position_pure(
     Returns:
         Tuple of (filepath, file_size_bytes)
     """
-    capture = ScreenCapture()
+    capture = get_shared_screen_capture()
 
-    try:
-        # Capture pure window content at position
-        image = capture.capture_window_at_position_pure(x, y, include_cursor)
+    # Capture pure window content at position
+    image = capture.capture_window_at_position_pure(x, y, include_cursor)
 
-        if image is None:
-            raise RuntimeError(
-                f"Failed to capture pure window content at position ({x}, {y})"
-            )
-
-        # Save the screenshot
-        filepath, file_size = capture.save_screenshot(
-            image, save_path, capture_type="win"
+    if image is None:
+        raise RuntimeError(
+            f"Failed to capture pure window content at position ({x}, {y})"
         )
 
-        # Copy to clipboard if requested
-        if copy_to_clipboard:
-            try:
-                if copy_image_to_clipboard(filepath):
-                    logger.info("Screenshot copied to clipboard")
-                else:
-                    logger.warning("Failed to copy screenshot to clipboard")
-            except Exception as e:
-                logger.warning(f"Clipboard copy failed: {e}")
+    # Save the screenshot
+    filepath, file_size = capture.save_screenshot(
+        image, save_path, capture_type="win"
+    )
 
-        # Show notification if requested
-        if show_notification:
-            try:
-                notify_screenshot_saved(filepath, file_size)
-            except Exception as e:
-                logger.warning(f"Failed to show notification: {e}")
+    # Copy to clipboard if requested
+    if copy_to_clipboard:
+        try:
+            if copy_image_to_clipboard(filepath):
+                logger.info("Screenshot copied to clipboard")
+            else:
+                logger.warning("Failed to copy screenshot to clipboard")
+        except Exception as e:
+            logger.warning(f"Clipboard copy failed: {e}")
 
-        return filepath, file_size
+    # Show notification if requested
+    if show_notification:
+        try:
+            notify_screenshot_saved(filepath, file_size)
+        except Exception as e:
+            logger.warning(f"Failed to show notification: {e}")
 
-    finally:
-        capture.cleanup()
+    return filepath, file_size
 
 
 if __name__ == "__main__":
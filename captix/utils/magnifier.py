@@ -15,9 +15,9 @@ Features implemented:
 
 import logging
 from typing import Optional
-from PyQt6.QtWidgets import QWidget
+from PyQt6.QtWidgets import QWidget, QApplication
 from PyQt6.QtCore import Qt, QRect, QPoint
-from PyQt6.QtGui import QPixmap, QPainter, QColor, QPen
+from PyQt6.QtGui import QPixmap, QPainter, QColor, QPen, QFont
 from captix.utils.theme import CaptiXColors
 
 logger = logging.getLogger(__name__)
@@ -94,11 +94,9 @@ class MagnifierWidget(QWidget):
         
         # Get screen geometry to ensure we stay within bounds
         try:
-            from PyQt6.QtWidgets import QApplication
             screen = QApplication.primaryScreen().geometry()
         except Exception:
             # Fallback to a reasonable screen size
-            from PyQt6.QtCore import QRect
             screen = QRect(0, 0, 1920, 1080)
         
         # Adjust if magnifier would go off-screen (move to other sides of cursor)
@@ -228,7 +226,6 @@ class MagnifierWidget(QWidget):
         painter.drawRect(self.rect().adjusted(1, 1, -1, -1))
 
         # Display current cursor coordinates
-        from PyQt6.QtGui import QFont
         painter.setFont(QFont("Arial", 12, QFont.Weight.Bold))
         painter.setPen(QPen(CaptiXColors.WHITE_TEXT_READABLE, 1))  # White text with high opacity
         
@@ -28,6 +28,8 @@ class CaptiXColors:
     # Background colors
     SEMI_TRANSPARENT_BLACK = QColor(0, 0, 0, 120)  # For text backgrounds
     DARK_BACKGROUND = QColor(40, 40, 40, 240)  # For magnifier background
+    FALLBACK_GRAY = QColor(128, 128, 128)  # Overlay background when no screen was captured
+    TRANSPARENT = QColor(0, 0, 0, 0)  # Video mode overlay background
 
     # Grid and guide colors (magnifier)
     SUBTLE_WHITE_GRID = QColor(255, 255, 255, 60)  # Grid lines
@@ -15,7 +15,7 @@ from enum import Enum
 from pathlib import Path
 
 from .audio_detect import AudioSystem
-from .capture import ScreenCapture
+from .capture import get_shared_screen_capture
 from .window_detect import WindowDetector
 
 logger = logging.getLogger(__name__)
@@ -44,7 +44,7 @@ class FFmpegRecorder:
         self.start_time: Optional[float] = None
         self.state = RecordingState.IDLE
         self.audio_system = AudioSystem()
-        self.capture = ScreenCapture()
+        self.capture = get_shared_screen_capture()  # Shared with the selection overlay
         self._hw_encoder = self._detect_hw_encoder()
         self._stderr_output: str = ""
         self._process_error: Optional[str] = None
@@ -601,9 +601,38 @@ class WindowDetector:
                     
         except Exception as e:
             logger.error(f"Failed to get visible windows: {e}")
-        
+
         return windows
 
+    def get_window_stack_rects(self) -> List[Tuple[int, int, int, int, int]]:
+        """
+        Get the rectangles of all viewable top-level windows, including docks,
+        desktop and other non-capturable windows that get_visible_windows skips.
+
+        Returns:
+            List of (window_id, x1, y1, x2, y2) tuples in bottom-to-top order
+        """
+        rects = []
+
+        try:
+            for child in self.root.query_tree().children:
+                try:
+                    attrs = child.get_attributes()
+                    if attrs.win_class != X.InputOutput or attrs.map_state != X.IsViewable:
+                        continue
+                    geometry = child.get_geometry()
+                    abs_x, abs_y = self._get_absolute_coordinates(child)
+                    rects.append(
+                        (child.id, abs_x, abs_y, abs_x + geometry.width, abs_y + geometry.height)
+                    )
+                except (BadWindow, BadMatch):
+                    continue
+
+        except Exception as e:
+            logger.error(f"Failed to get window stack rectangles: {e}")
+
+        return rects
+
     def get_current_workspace(self) -> Optional[int]:
         """Get the current workspace/desktop number."""
         try:
@@ -689,8 +718,14 @@ class WindowDetector:
         """Check if window is too small to be a useful screenshot target."""
         return window_info.width < min_size or window_info.height < min_size
 
-    def filter_windows_for_capture(self, windows: List[WindowInfo]) -> List[WindowInfo]:
-        """Filter windows to only include those suitable for capture."""
+    def filter_windows_for_capture(
+        self, windows: List[WindowInfo], min_size: int = 200
+    ) -> List[WindowInfo]:
+        """Filter windows to only include those suitable for capture.
+
+        Windows narrower or shorter than min_size are skipped; pass 0 to keep
+        every on-workspace window regardless of size.
+        """
         current_workspace = self.get_current_workspace()
         filtered_windows = []
 
@@ -705,7 +740,7 @@ class WindowDetector:
                     continue
 
                 # Skip very small windows
-                if self.is_window_too_small(window_info):
+                if self.is_window_too_small(window_info, min_size):
                     continue
 
                 # Get the actual X11 window object for further checks